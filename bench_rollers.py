@@ -0,0 +1,317 @@
+"""
+Benchmarks for the roller hot paths and the builder's parsers.
+
+    python bench_rollers.py                      # everything, text report
+    python bench_rollers.py --quick --only rolls
+    python bench_rollers.py --json new.json --compare old.json
+
+Groups:
+  rolls    rolls/sec of roll_jumpship, roll_dropship (several filter sets,
+           warm cache and cold) and roll_from_db, on the real data and on
+           synthetic DBs of --sizes classes
+  startup  wall time of `python -c "import bt_ship_rollers"` and of a first
+           DropShip roll, minus a bare interpreter start
+  parse    throughput of extract_infobox_fields_from_wikitext, strip_tags,
+           wikitext_to_text and guess_rarity over the pages in bench_fixtures/
+
+--json writes every measurement as {"key", "value", "unit", ...} so two runs
+can be diffed; --compare prints the ratio against an earlier file.
+"""
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+import bt_ship_rollers as bt
+import build_dropship_overrides as builder
+from roll_tables import HAVE_NUMPY
+from ship_store import ShipStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, "bench_fixtures")
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+DROPSHIP_CASES = [
+    ("any", {}),
+    ("IS <=3025 strict", dict(tech_choice="IS", year=3025, strict_year=True)),
+    ("Clan common+uncommon", dict(tech_choice="Clan", rarity_mode="common_uncommon")),
+    ("<=3050 common, no unknowns", dict(year=3050, rarity_mode="common",
+                                        include_unknown_rarity=False, include_unknown_tech=False)),
+]
+
+DB_CASES = [
+    ("any", {}),
+    ("<=2400 known years", dict(max_year=2400, include_unknown_years=False)),
+    ("IS common/uncommon", dict(allowed_tech={"IS"}, allowed_rarities={"common", "uncommon"})),
+]
+
+# Rough shape of the real DropShip data.
+SYNTHETIC_TECH = (("IS", 0.70), ("Clan", 0.15), ("Unknown", 0.15))
+SYNTHETIC_RARITY = (("unknown", 0.55), ("common", 0.10), ("uncommon", 0.05),
+                    ("rare", 0.20), ("very_rare", 0.10))
+SYNTHETIC_UNKNOWN_YEAR_SHARE = 0.05
+
+
+def synthetic_ship_db(n, seed=0):
+    """
+    ShipStore of n made-up classes with the rough tech/rarity/year mix of
+    the real data (years 2100-3150, a few unknown). Same n and seed, same DB.
+    """
+    rng = random.Random(seed)
+    techs, tech_w = zip(*SYNTHETIC_TECH)
+    rarities, rarity_w = zip(*SYNTHETIC_RARITY)
+    tech_col = rng.choices(techs, tech_w, k=n)
+    rarity_col = rng.choices(rarities, rarity_w, k=n)
+    rows = []
+    for i in range(n):
+        year = None if rng.random() < SYNTHETIC_UNKNOWN_YEAR_SHARE else rng.randint(2100, 3150)
+        rows.append({
+            "name": f"Synthetic-{i:06d}",
+            "year": year,
+            "tech": tech_col[i],
+            "rarity": rarity_col[i],
+        })
+    return ShipStore.from_rows(rows)
+
+
+# ============================================================
+# Timing
+# ============================================================
+
+def per_second(fn, repeat=5, min_time=0.2):
+    """Calls per second of fn(), best of `repeat` auto-ranged runs."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed * 1.2))
+    best = min(timer.repeat(repeat - 1, number) + [elapsed])
+    return number / best
+
+
+class Results:
+    """Collects measurements and prints them as they come in."""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, group, name, value, unit, **info):
+        key = " | ".join([group, name] + [f"{k}={v}" for k, v in sorted(info.items())])
+        self.rows.append({"key": key, "group": group, "name": name,
+                          "value": value, "unit": unit, **info})
+        print(f"  {key:<72} {value:>14,.1f} {unit}", flush=True)
+
+
+# ============================================================
+# Roll benchmarks
+# ============================================================
+
+def _bench_dropship_cases(results, size, repeat, min_time):
+    for case, kwargs in DROPSHIP_CASES:
+        if bt.get_dropship_table(**kwargs) is None:
+            continue
+        results.add("rolls", "roll_dropship", per_second(
+            lambda: bt.roll_dropship(**kwargs), repeat, min_time),
+            "rolls/s", case=case, classes=size)
+
+        def cold():
+            bt.invalidate_roll_cache()
+            bt.roll_dropship(**kwargs)
+        # Cold = index build + one draw straight off the index, i.e. the
+        # first roll after the data changed.
+        results.add("rolls", "roll_dropship_cold", per_second(cold, repeat, min_time),
+                    "rolls/s", case=case, classes=size)
+
+
+def _bench_db_cases(results, db, rarity_weights, size, repeat, min_time):
+    for case, kwargs in DB_CASES:
+        if bt.get_db_table(db, rarity_weights=rarity_weights, **kwargs) is None:
+            continue
+        results.add("rolls", "roll_from_db", per_second(
+            lambda: bt.roll_from_db(db, rarity_weights=rarity_weights, **kwargs),
+            repeat, min_time), "rolls/s", case=case, classes=size)
+
+
+def bench_rolls(results, sizes, repeat=5, min_time=0.2):
+    results.add("rolls", "roll_jumpship", per_second(bt.roll_jumpship, repeat, min_time), "rolls/s")
+
+    dropship_db = bt.DROPSHIP_DB
+    if dropship_db:
+        _bench_dropship_cases(results, len(dropship_db), repeat, min_time)
+
+    primitive_db = bt.PRIMITIVE_JUMPSHIP_DB
+    _bench_db_cases(results, primitive_db, bt.PRIMITIVE_RARITY_WEIGHTS,
+                    len(primitive_db), repeat, min_time)
+
+    try:
+        for size in sizes:
+            db = synthetic_ship_db(size)
+            bt.DROPSHIP_DB = db
+            _bench_dropship_cases(results, size, repeat, min_time)
+            _bench_db_cases(results, db, bt.DEFAULT_PRIMITIVE_RARITY_WEIGHTS, size, repeat, min_time)
+    finally:
+        bt.DROPSHIP_DB = dropship_db
+        bt.invalidate_roll_cache()
+
+
+# ============================================================
+# Startup benchmarks
+# ============================================================
+
+def _run_python_ms(code, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench_startup(results, runs=15):
+    # Warm the byte-code and data caches so every run sees the same state.
+    _run_python_ms("import bt_ship_rollers as bt; bt.roll_dropship()", 1)
+
+    bare = _run_python_ms("pass", runs)
+    results.add("startup", "interpreter", bare, "ms")
+    results.add("startup", "import bt_ship_rollers",
+                _run_python_ms("import bt_ship_rollers", runs) - bare, "ms")
+    results.add("startup", "import + first roll_dropship",
+                _run_python_ms("import bt_ship_rollers as bt; bt.roll_dropship()", runs) - bare, "ms")
+
+
+# ============================================================
+# Parse benchmarks
+# ============================================================
+
+def load_fixtures():
+    """({name: wikitext}, {name: html}) from bench_fixtures/."""
+    def read(pattern):
+        out = {}
+        for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, pattern))):
+            with open(path, encoding="utf-8") as f:
+                out[os.path.splitext(os.path.basename(path))[0]] = f.read()
+        return out
+    return read("*.wikitext"), read("*.html")
+
+
+def _bench_parser(results, name, fn, pages, repeat, min_time):
+    pages = list(pages)
+    total_bytes = sum(len(p.encode("utf-8")) for p in pages)
+
+    def run():
+        for p in pages:
+            fn(p)
+
+    calls = per_second(run, repeat, min_time)
+    results.add("parse", name, calls * len(pages), "pages/s")
+    results.add("parse", name, calls * total_bytes / 1e6, "MB/s")
+
+
+def bench_parse(results, repeat=5, min_time=0.2):
+    wikitext, html_pages = load_fixtures()
+    if not wikitext or not html_pages:
+        print(f"  (no fixtures in {FIXTURE_DIR}; skipping)")
+        return
+    text_pages = [builder.strip_tags(h) for h in html_pages.values()]
+
+    _bench_parser(results, "extract_infobox_fields_from_wikitext",
+                  builder.extract_infobox_fields_from_wikitext, wikitext.values(), repeat, min_time)
+    _bench_parser(results, "strip_tags", builder.strip_tags, html_pages.values(), repeat, min_time)
+    _bench_parser(results, "wikitext_to_text", builder.wikitext_to_text, wikitext.values(),
+                  repeat, min_time)
+    _bench_parser(results, "guess_rarity", builder.guess_rarity, text_pages, repeat, min_time)
+
+
+# ============================================================
+# Results files
+# ============================================================
+
+def environment():
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": HAVE_NUMPY,
+        "dont_write_bytecode": bool(os.environ.get("PYTHONDONTWRITEBYTECODE")),
+        "git_revision": revision,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(rows, old_path):
+    """Print new/old ratio for every key both runs measured (>1 = faster)."""
+    with open(old_path, encoding="utf-8") as f:
+        old = {r["key"] + " " + r["unit"]: r for r in json.load(f)["results"]}
+
+    print(f"\nCompared with {old_path} (ratio > 1 is better):")
+    for r in rows:
+        prev = old.get(r["key"] + " " + r["unit"])
+        if prev is None or not prev["value"]:
+            continue
+        ratio = r["value"] / prev["value"]
+        if r["unit"] == "ms":  # lower is better
+            ratio = 1 / ratio if ratio else float("inf")
+        print(f"  {r['key'] + ' ' + r['unit']:<80} {ratio:6.2f}x")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the rollers and builder parsers.")
+    parser.add_argument("--only", help="comma-separated groups: rolls, startup, parse")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="synthetic DB sizes (default %(default)s)")
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter runs")
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="earlier --json file to compare with")
+    args = parser.parse_args(argv)
+
+    groups = set(args.only.split(",")) if args.only else {"rolls", "startup", "parse"}
+    unknown = groups - {"rolls", "startup", "parse"}
+    if unknown:
+        parser.error(f"unknown group(s): {', '.join(sorted(unknown))}")
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    repeat, min_time, runs = (3, 0.05, 5) if args.quick else (5, 0.2, 15)
+
+    results = Results()
+    env = environment()
+    print(f"Python {env['python']} ({env['implementation']}), NumPy: {env['numpy']}")
+
+    if "rolls" in groups:
+        print("Rolls:")
+        bench_rolls(results, sizes, repeat, min_time)
+    if "startup" in groups:
+        print("Startup:")
+        bench_startup(results, runs)
+    if "parse" in groups:
+        print("Parse:")
+        bench_parse(results, repeat, min_time)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"environment": env, "results": results.rows}, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {args.json}")
+    if args.compare:
+        compare(results.rows, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
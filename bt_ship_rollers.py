@@ -1,47 +1,256 @@
+import marshal
+import os
 import random
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from itertools import islice
+
+from roll_tables import (
+    RollTable,
+    Table,
+    YearIndex,
+    batch_indices,
+    indices_to_labels,
+    iter_index_chunks,
+    spawn_rng,
+)
+from roll_tables import make_rng  # noqa: F401 -- re-exported for callers: bt.make_rng(seed)
+from ship_store import ShipStore
+
+
+# ============================================================
+# Roller stats (opt-in)
+# ============================================================
+# Off unless BT_ROLLER_STATS is set (or enable_roller_stats() / the CLI's
+# --stats flag turns it on). Every hook is an `if _STATS is not None`
+# check, so the roll path does no extra work while it is off.
+
+ROLLER_STATS_ENV = "BT_ROLLER_STATS"
+
+ROLLER_COUNTERS = (
+    "pool_builds",            # filtered tables compiled
+    "index_builds",           # YearIndex (re)builds over a DB
+    "cache_hits",
+    "cache_misses",
+    "candidates_considered",  # classes placed in the pools built
+    "rolls_jumpship",
+    "rolls_dropship",
+    "rolls_db",
+)
+
+
+class _Histogram:
+    """Counts of durations in fixed log-spaced buckets (seconds)."""
+
+    BOUNDS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4,
+              1e-3, 2e-3, 5e-3, 1e-2, 2e-2, 5e-2, 0.1, 0.2, 0.5, 1.0)
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def snapshot(self):
+        count = sum(self.counts)
+        buckets = {}
+        for i, k in enumerate(self.counts):
+            if k:
+                label = f"<={_format_seconds(self.BOUNDS[i])}" if i < len(self.BOUNDS) else ">1s"
+                buckets[label] = k
+        return {
+            "count": count,
+            "total_ms": self.total * 1e3,
+            "mean_us": self.total / count * 1e6 if count else 0.0,
+            "max_us": self.max * 1e6,
+            "buckets": buckets,
+        }
+
+
+def _format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:g}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:g}ms"
+    return f"{seconds:g}s"
+
+
+class _RollerStats:
+    __slots__ = ("counters", "filter_time", "sample_time")
+
+    def __init__(self):
+        self.counters = dict.fromkeys(ROLLER_COUNTERS, 0)
+        self.filter_time = _Histogram()
+        self.sample_time = _Histogram()
+
+    def sample(self, kind, n, fn, *args):
+        """Run fn(*args) as a draw of n rolls of `kind`, timed."""
+        start = time.perf_counter()
+        result = fn(*args)
+        self.sample_time.add(time.perf_counter() - start)
+        self.counters["rolls_" + kind] += n
+        return result
+
+    def stream(self, kind, rolls):
+        """Pass an endless roll stream through, counting what is taken."""
+        counters = self.counters
+        key = "rolls_" + kind
+        for r in rolls:
+            counters[key] += 1
+            yield r
+
+
+def _env_flag(name):
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+_STATS = _RollerStats() if _env_flag(ROLLER_STATS_ENV) else None
+
+
+def enable_roller_stats(enabled=True):
+    """Turn stats collection on (fresh counters) or off."""
+    global _STATS
+    _STATS = _RollerStats() if enabled else None
+
+
+def roller_stats_enabled():
+    return _STATS is not None
+
+
+def timed_sample(kind, n, fn, *args):
+    """
+    fn(*args), recorded as a draw of n `kind` rolls ("jumpship",
+    "dropship" or "db") when stats are on. For callers that sample a
+    table themselves, e.g. the batch CLI and roll_server.py.
+    """
+    if _STATS is not None:
+        return _STATS.sample(kind, n, fn, *args)
+    return fn(*args)
+
+
+def get_roller_stats():
+    """
+    Snapshot of the roller stats: {"enabled", "counters", "filter_time",
+    "sample_time", "roll_cache"}. Timing entries are histogram summaries.
+    While stats are off only "enabled" and "roll_cache" are filled in.
+    """
+    stats = {"enabled": _STATS is not None, "roll_cache": roll_cache_stats()}
+    if _STATS is not None:
+        stats["counters"] = dict(_STATS.counters)
+        stats["filter_time"] = _STATS.filter_time.snapshot()
+        stats["sample_time"] = _STATS.sample_time.snapshot()
+    return stats
+
+
+def format_roller_stats(stats=None):
+    """get_roller_stats() as printable lines."""
+    stats = stats or get_roller_stats()
+    if not stats["enabled"]:
+        return [f"Roller stats are off (set {ROLLER_STATS_ENV}=1 or use --stats)."]
+
+    lines = ["Counters:"]
+    lines.extend(f"  {name}: {value}" for name, value in stats["counters"].items())
+    for name in ("filter_time", "sample_time"):
+        h = stats[name]
+        lines.append(
+            f"{name}: {h['count']} calls, total {h['total_ms']:.3f} ms, "
+            f"mean {h['mean_us']:.1f} us, max {h['max_us']:.1f} us"
+        )
+        if h["buckets"]:
+            lines.append("  " + "  ".join(f"{b}: {k}" for b, k in h["buckets"].items()))
+    return lines
 
 
 # ============================================================
 # JumpShip roller
 # ============================================================
 
-def roll_jumpship():
+# 3025-ish Inner Sphere chart. The minor bucket is a nested d6; compiling
+# flattens it into the d100 table so a roll is a single draw.
+JUMPSHIP_MINOR_CHART = Table.from_die(6, [
+    (1, 2, "Tramp (minor bucket)"),
+    (3, 3, "Leviathan (minor bucket)"),
+    (4, 4, "Liberty (minor bucket)"),
+    (5, 5, "Uma (minor bucket)"),
+    (6, 6, "Other minor (your pick) (minor bucket)"),
+])
+
+JUMPSHIP_CHART = Table.from_die(100, [
+    (1, 46, "Invader"),
+    (47, 78, "Merchant"),
+    (79, 89, "Scout"),
+    (90, 94, "Star Lord"),
+    (95, 97, "Monolith"),
+    (98, 100, JUMPSHIP_MINOR_CHART),
+])
+
+JUMPSHIP_TABLE = JUMPSHIP_CHART.compile()
+
+# (label, weight out of 100) for every flattened outcome.
+JUMPSHIP_OUTCOMES = list(zip(JUMPSHIP_TABLE.items, JUMPSHIP_TABLE.weights))
+
+
+def roll_jumpship(rng=None):
     """3025-ish Inner Sphere distribution:
     Invader 46%, Merchant 32%, Scout 11%, Star Lord 5%, Monolith 3%, Minor 3%.
     """
-    r = random.randint(1, 100)
-
-    if r <= 46:
-        return "Invader"
-    elif r <= 78:
-        return "Merchant"
-    elif r <= 89:
-        return "Scout"
-    elif r <= 94:
-        return "Star Lord"
-    elif r <= 97:
-        return "Monolith"
+    if _STATS is not None:
+        return _STATS.sample("jumpship", 1, JUMPSHIP_TABLE.roll, rng or random)
+    return JUMPSHIP_TABLE.roll(rng or random)
+
+
+def roll_many_jumpships(n, rng=None):
+    if _STATS is not None:
+        return _STATS.sample("jumpship", n, JUMPSHIP_TABLE.sample, n, rng or random)
+    return JUMPSHIP_TABLE.sample(n, rng or random)
+
+
+def roll_jumpship_batch(n, labels=False, seed=None):
+    """
+    n JumpShip rolls as indices into JUMPSHIP_TABLE.items (a NumPy array
+    when NumPy is installed), or as class labels if labels=True.
+    """
+    if _STATS is not None:
+        idx = _STATS.sample("jumpship", n, batch_indices, JUMPSHIP_TABLE, n, seed)
     else:
-        minor_roll = random.randint(1, 6)
-        minor = {
-            1: "Tramp",
-            2: "Tramp",
-            3: "Leviathan",
-            4: "Liberty",
-            5: "Uma",
-            6: "Other minor (your pick)",
-        }[minor_roll]
-        return f"{minor} (minor bucket)"
+        idx = batch_indices(JUMPSHIP_TABLE, n, seed=seed)
+    if labels:
+        return indices_to_labels(idx, JUMPSHIP_TABLE.items)
+    return idx
+
 
+def iter_jumpships():
+    """Endless lazy stream of JumpShip rolls (same odds as roll_jumpship)."""
+    if _STATS is not None:
+        return _STATS.stream("jumpship", JUMPSHIP_TABLE.iter_rolls())
+    return JUMPSHIP_TABLE.iter_rolls()
 
-def roll_many_jumpships(n):
-    return [roll_jumpship() for _ in range(n)]
+
+def roll_jumpship_counts(n):
+    """How many of each JumpShip class in n rolls, without rolling them one by one."""
+    if _STATS is not None:
+        counts = _STATS.sample("jumpship", n, JUMPSHIP_TABLE.sample_counts, n)
+    else:
+        counts = JUMPSHIP_TABLE.sample_counts(n)
+    return {label: k for label, k in zip(JUMPSHIP_TABLE.items, counts) if k}
 
 
 def interactive_jumpship_roller():
     print("JumpShip Class Roller (d100 weighted)")
     print("Type 'q' at any prompt to quit.\n")
 
+    rolls = iter_jumpships()
+
     while True:
         raw = input("How many JumpShips do you want to roll? ").strip()
         if raw.lower() in ("q", "quit", "exit"):
@@ -57,8 +266,7 @@ def interactive_jumpship_roller():
             print("Please enter a whole number (e.g., 1, 5, 20) or 'q' to quit.\n")
             continue
 
-        results = roll_many_jumpships(n)
-        for i, cls in enumerate(results, start=1):
+        for i, cls in enumerate(islice(rolls, n), start=1):
             print(f"JS-{i:02d}: {cls}")
         print()
 
@@ -85,14 +293,18 @@ ERA_RANGES = [
 ]
 
 
+_ERA_STARTS = [start for _, start, _ in ERA_RANGES]
+
+
 def era_for_year(year: int) -> str:
-    for name, start, end in ERA_RANGES:
-        if start <= year <= end:
-            return name
+    i = bisect_right(_ERA_STARTS, year) - 1
+    if i >= 0 and year <= ERA_RANGES[i][2]:
+        return ERA_RANGES[i][0]
     return "Unknown"
 
 
-RARITY_WEIGHT = {
+# Fallback for RARITY_WEIGHT when rarity_weights.json has no "dropship" table.
+DEFAULT_RARITY_WEIGHT = {
     "common": 10.0,
     "uncommon": 3.0,
     "rare": 1.0,
@@ -102,25 +314,73 @@ RARITY_WEIGHT = {
 
 
 # ---- Load auto-generated overrides (dropship_overrides.py) ----
-try:
-    from dropship_overrides import DROPSHIP_OVERRIDES
-except Exception:
-    DROPSHIP_OVERRIDES = {}
-
-
-# ---- Optional: your personal patches that always win (edit freely) ----
-LOCAL_OVERRIDES = {
-    # Inferred / lore-only / “extinct-ish”
-    "League": {"year": 2750, "tech": "IS", "rarity": "very_rare"},
-    "Hector": {"year": 2600, "tech": "IS", "rarity": "very_rare"},
-    "Scout":  {"year": 3055, "tech": "Clan", "rarity": "rare"},
-    "Talon":  {"year": 3062, "tech": "IS", "rarity": "uncommon"},
-
-    # Prototypes / abandoned production => near-one-offs
-    "Cargomaster": {"rarity": "very_rare"},
-    "Cargoking":   {"rarity": "very_rare"},
-    "Argo":        {"rarity": "very_rare"},
-}
+def _load_dropship_overrides():
+    try:
+        from dropship_overrides import DROPSHIP_OVERRIDES
+    except Exception:
+        DROPSHIP_OVERRIDES = {}
+    return {"DROPSHIP_OVERRIDES": DROPSHIP_OVERRIDES}
+
+
+# ---- Your tuning data (edit freely; see poll_overrides() for live reload) ----
+#   local_overrides.json               personal DropShip patches that always
+#                                      win (LOCAL_OVERRIDES), by class name
+#   primitive_jumpship_overrides.json  the same for Primitive JumpShips
+#                                      (PRIMITIVE_JS_OVERRIDES)
+#   rarity_weights.json                {"dropship": RARITY_WEIGHT,
+#                                       "primitive": PRIMITIVE_RARITY_WEIGHTS}
+LOCAL_OVERRIDES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "local_overrides.json"
+)
+PRIMITIVE_OVERRIDES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "primitive_jumpship_overrides.json"
+)
+RARITY_WEIGHTS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "rarity_weights.json"
+)
+
+
+def _tuning_paths():
+    return (LOCAL_OVERRIDES_PATH, PRIMITIVE_OVERRIDES_PATH, RARITY_WEIGHTS_PATH)
+
+
+def _read_json_file(path, default):
+    import json
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return default
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+    return data
+
+
+def _load_tuning_data(paths=None):
+    """Override and weight tables from the tuning files (all, or those in `paths`)."""
+    data = {}
+    if paths is None or LOCAL_OVERRIDES_PATH in paths:
+        data["LOCAL_OVERRIDES"] = _read_json_file(LOCAL_OVERRIDES_PATH, {})
+    if paths is None or PRIMITIVE_OVERRIDES_PATH in paths:
+        data["PRIMITIVE_JS_OVERRIDES"] = _read_json_file(PRIMITIVE_OVERRIDES_PATH, {})
+    if paths is None or RARITY_WEIGHTS_PATH in paths:
+        weights = _read_json_file(RARITY_WEIGHTS_PATH, {})
+        data["RARITY_WEIGHT"] = weights.get("dropship", dict(DEFAULT_RARITY_WEIGHT))
+        data["PRIMITIVE_RARITY_WEIGHTS"] = weights.get(
+            "primitive", dict(DEFAULT_PRIMITIVE_RARITY_WEIGHTS))
+    return data
+
+
+def _dropship_row(name, data):
+    return {
+        "name": name,
+        "tech": data.get("tech") if data.get("tech") is not None else "Unknown",
+        "year": data.get("year"),
+        "rarity": data.get("rarity") if data.get("rarity") is not None else "unknown",
+    }
 
 
 def build_dropship_db():
@@ -129,15 +389,11 @@ def build_dropship_db():
     otherwise fall back to an empty list.
     """
     db = []
+    overrides = _data("DROPSHIP_OVERRIDES")
 
-    if DROPSHIP_OVERRIDES:
-        for name, data in DROPSHIP_OVERRIDES.items():
-            db.append({
-                "name": name,
-                "tech": data.get("tech") if data.get("tech") is not None else "Unknown",
-                "year": data.get("year"),
-                "rarity": data.get("rarity") if data.get("rarity") is not None else "unknown",
-            })
+    if overrides:
+        for name, data in overrides.items():
+            db.append(_dropship_row(name, data))
         db.sort(key=lambda d: d["name"].lower())
         return db
 
@@ -155,11 +411,250 @@ def apply_overrides(dropship_db, overrides):
             by_name[name]["tech"] = data["tech"]
         if data.get("rarity") is not None:
             by_name[name]["rarity"] = data["rarity"]
+        for field in PRODUCTION_CURVE_FIELDS:
+            if data.get(field) is not None:
+                by_name[name][field] = data[field]
     return dropship_db
 
 
-DROPSHIP_DB = build_dropship_db()
-DROPSHIP_DB = apply_overrides(DROPSHIP_DB, LOCAL_OVERRIDES)
+# ---- Production curves (optional, year-dependent weights) ----
+# With a year cutoff, a class's weight is its rarity weight times
+# production_factor() for that year. Per class, via local_overrides.json (or
+# primitive_jumpship_overrides.json):
+#   "ramp_years":   production ramps up linearly over this many years after
+#                   the intro year (default PRODUCTION_RAMP_YEARS; 0 = none)
+#   "decline_year": from this year production falls off linearly, to 0 at
+#                   "extinct_year" if given, else to PRODUCTION_DECLINE_FLOOR
+#                   over PRODUCTION_DECLINE_YEARS
+#   "extinct_year": from this year on the class is not rolled at all
+# Classes without curve fields keep their static weight, and rolls without
+# a year cutoff ignore the curves. Factors are computed once per (DB, year)
+# and cached, so sweeping years is a dict lookup per class.
+
+PRODUCTION_CURVE_FIELDS = ("ramp_years", "decline_year", "extinct_year")
+PRODUCTION_RAMP_YEARS = 0
+PRODUCTION_DECLINE_YEARS = 50
+PRODUCTION_DECLINE_FLOOR = 0.1
+PRODUCTION_CACHE_SIZE = 512
+
+_PRODUCTION_CURVES = OrderedDict()
+_PRODUCTION_FACTORS = OrderedDict()
+
+
+def production_factor(intro, year, ramp_years=None, decline_year=None, extinct_year=None):
+    """Weight multiplier (0..1) in `year` for a class introduced in `intro`."""
+    if extinct_year is not None and year >= extinct_year:
+        return 0.0
+
+    factor = 1.0
+    ramp = PRODUCTION_RAMP_YEARS if ramp_years is None else ramp_years
+    if ramp > 0 and intro is not None and year < intro + ramp:
+        factor = max(year - intro + 1, 1) / ramp
+
+    if decline_year is not None and year > decline_year:
+        if extinct_year is not None and extinct_year > decline_year:
+            factor *= (extinct_year - year) / (extinct_year - decline_year)
+        else:
+            t = (year - decline_year) / PRODUCTION_DECLINE_YEARS if PRODUCTION_DECLINE_YEARS > 0 else 1.0
+            factor *= 1.0 - (1.0 - PRODUCTION_DECLINE_FLOOR) * min(t, 1.0)
+    return factor
+
+
+def _production_settings():
+    return (PRODUCTION_RAMP_YEARS, PRODUCTION_DECLINE_YEARS, PRODUCTION_DECLINE_FLOOR)
+
+
+def _lru_get(cache, key, owner):
+    cached = cache.get(key)
+    if cached is not None and cached[0] is owner:
+        cache.move_to_end(key)
+        return cached[1]
+    return None
+
+
+def _lru_put(cache, key, owner, value, size):
+    cache[key] = (owner, value)
+    while len(cache) > max(size, 0):
+        cache.popitem(last=False)
+    return value
+
+
+def _production_curves(db):
+    """(name, intro, ramp_years, decline_year, extinct_year) for rows with a curve."""
+    key = (id(db), len(db), getattr(db, "generation", 0), _DB_GENERATION, PRODUCTION_RAMP_YEARS)
+    curves = _lru_get(_PRODUCTION_CURVES, key, db)
+    if curves is not None:
+        return curves
+
+    curves = []
+    for d in db:
+        ramp, decline, extinct = (d.get(field) for field in PRODUCTION_CURVE_FIELDS)
+        if ramp is None and decline is None and extinct is None and not PRODUCTION_RAMP_YEARS:
+            continue
+        curves.append((d["name"], d.get("year"), ramp, decline, extinct))
+    return _lru_put(_PRODUCTION_CURVES, key, db, curves, DB_INDEX_CACHE_SIZE)
+
+
+def production_factors(db, year):
+    """
+    {class name: factor} for the classes of `db` whose weight in `year`
+    differs from the static one. Cached per DB and year.
+    """
+    key = (id(db), len(db), getattr(db, "generation", 0), _DB_GENERATION,
+           _production_settings(), year)
+    factors = _lru_get(_PRODUCTION_FACTORS, key, db)
+    if factors is not None:
+        return factors
+
+    factors = {}
+    for name, intro, ramp, decline, extinct in _production_curves(db):
+        f = production_factor(intro, year, ramp, decline, extinct)
+        if f != 1.0:
+            factors[name] = f
+    return _lru_put(_PRODUCTION_FACTORS, key, db, factors, PRODUCTION_CACHE_SIZE)
+
+
+def _apply_production_curves(items, weights, db, year, name_of):
+    """Scale (items, weights) by production_factors(db, year); drop extinct classes."""
+    if year is None:
+        return items, weights
+    factors = production_factors(db, year)
+    if not factors:
+        return items, weights
+
+    out_items = []
+    out_weights = []
+    for item, w in zip(items, weights):
+        f = factors.get(name_of(item), 1.0)
+        if f > 0:
+            out_items.append(item)
+            out_weights.append(w * f)
+    return out_items, out_weights
+
+
+# ---- Ship data: built on first use, cached across runs ----
+# DROPSHIP_DB, DROPSHIP_OVERRIDES, PRIMITIVE_JUMPSHIP_DB and the tuning data
+# (LOCAL_OVERRIDES, PRIMITIVE_JS_OVERRIDES, RARITY_WEIGHT,
+# PRIMITIVE_RARITY_WEIGHTS) are not loaded at import. The first roller (or
+# attribute access from outside) loads them; the merged DBs are kept in a
+# marshal file that is reused until a source file's mtime or size changes.
+
+DATA_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__pycache__", "bt_ship_data.marshal"
+)
+_DATA_CACHE_FORMAT = 4
+_STORE_DATA = ("DROPSHIP_DB", "PRIMITIVE_JUMPSHIP_DB")
+_DATA_SOURCES = ("dropship_overrides", "primitive_jumpships")
+
+# (mtime_ns, size) of each tuning file as last loaded; see poll_overrides().
+_TUNING_STAMPS = {}
+# Held for the whole of a poll_overrides() pass, stat() checks included.
+_RELOAD_LOCK = threading.Lock()
+
+
+def _source_path(module_name):
+    for d in sys.path:
+        path = os.path.join(d or os.curdir, module_name + ".py")
+        if os.path.isfile(path):
+            return os.path.abspath(path)
+    return None
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError):
+        return (None, None)
+
+
+def _data_sources_stamp():
+    stamp = [_DATA_CACHE_FORMAT, tuple(sys.version_info[:2])]
+    paths = ([os.path.abspath(__file__)] + [_source_path(m) for m in _DATA_SOURCES]
+             + list(_tuning_paths()))
+    for path in paths:
+        stamp.append((path,) + _file_stamp(path))
+    return tuple(stamp)
+
+
+def _read_data_cache(stamp):
+    try:
+        with open(DATA_CACHE_PATH, "rb") as f:
+            cached_stamp, data = marshal.load(f)
+    except Exception:
+        return None
+    return data if cached_stamp == stamp else None
+
+
+def _write_data_cache(stamp, data):
+    tmp = f"{DATA_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(DATA_CACHE_PATH), exist_ok=True)
+        with open(tmp, "wb") as f:
+            marshal.dump((stamp, data), f)
+        os.replace(tmp, DATA_CACHE_PATH)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_ship_data(use_cache=True):
+    """
+    Build the merged DropShip and Primitive JumpShip DBs (or read them from
+    DATA_CACHE_PATH) and publish them as module globals. Both DBs are
+    columnar ShipStores; indexing one gives a dict-style row view.
+    """
+    stamp = _data_sources_stamp()
+    cached = _read_data_cache(stamp) if use_cache else None
+    if cached is not None:
+        data = dict(cached)
+        for name in _STORE_DATA:
+            data[name] = ShipStore.from_columns(data[name])
+    else:
+        data = _load_tuning_data()
+        data["DROPSHIP_DB"] = apply_overrides(build_dropship_db(), data["LOCAL_OVERRIDES"])
+        data["PRIMITIVE_JUMPSHIP_DB"] = _load_primitive_db(data["PRIMITIVE_JS_OVERRIDES"])
+        for name in _STORE_DATA:
+            data[name] = ShipStore.from_rows(data[name])
+        if use_cache:
+            columns = dict(data)
+            for name in _STORE_DATA:
+                columns[name] = data[name].to_columns()
+            _write_data_cache(stamp, columns)
+    tuning = set(_tuning_paths())
+    _TUNING_STAMPS.update((path, (mtime, size)) for path, mtime, size in stamp[2:]
+                          if path in tuning)
+    globals().update(data)
+
+
+_LAZY_DATA = {
+    "DROPSHIP_OVERRIDES": _load_dropship_overrides,
+    "DROPSHIP_DB": None,
+    "PRIMITIVE_JUMPSHIP_DB": None,
+    "LOCAL_OVERRIDES": None,
+    "PRIMITIVE_JS_OVERRIDES": None,
+    "RARITY_WEIGHT": None,
+    "PRIMITIVE_RARITY_WEIGHTS": None,
+}
+
+
+def _data(name):
+    g = globals()
+    if name not in g:
+        loader = _LAZY_DATA[name]
+        if loader is None:
+            load_ship_data()
+        else:
+            g.update(loader())
+    return g[name]
+
+
+def __getattr__(name):
+    if name in _LAZY_DATA:
+        return _data(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def weighted_choice(items, weights):
@@ -187,7 +682,30 @@ def tech_allowed(item_tech: str, tech_choice: str, include_unknown_tech: bool) -
     return item_tech == tech_choice
 
 
-def roll_dropship(
+def _dropship_predicate(tech_choice, rarity_mode, include_unknown_rarity, include_unknown_tech):
+    def predicate(key):
+        return (tech_allowed(key[0], tech_choice, include_unknown_tech)
+                and rarity_allowed(key[1], rarity_mode, include_unknown_rarity))
+    return predicate
+
+
+def _dropship_pool(tech_choice, year, strict_year, rarity_mode,
+                   include_unknown_rarity, include_unknown_tech):
+    """
+    (classes, weights) passing the filters. Goes through dropship_index():
+    only the matching (tech, rarity) buckets are visited and the year
+    cutoff is a bisect per bucket.
+    """
+    items, weights = dropship_index().candidates(
+        _dropship_predicate(tech_choice, rarity_mode, include_unknown_rarity, include_unknown_tech),
+        max_year=year,
+        include_unknown_years=not strict_year,
+    )
+    return _apply_production_curves(items, weights, _data("DROPSHIP_DB"), year,
+                                    lambda r: r.name)
+
+
+def compile_dropship_table(
     tech_choice="Any",
     year=None,
     strict_year=False,
@@ -195,34 +713,193 @@ def roll_dropship(
     include_unknown_rarity=True,
     include_unknown_tech=True
 ):
-    if not DROPSHIP_DB:
-        return "No DropShip data loaded. Run build_dropship_overrides.py first."
+    """
+    Filter DROPSHIP_DB once and compile the survivors into a RollTable.
+    Returns None if no class passes the filters.
+    """
+    pool, weights = _dropship_pool(
+        tech_choice, year, strict_year, rarity_mode,
+        include_unknown_rarity, include_unknown_tech,
+    )
+    if not pool or sum(weights) <= 0:
+        return None
+    return RollTable(pool, weights)
 
-    pool = []
-    pool_weights = []
 
-    for d in DROPSHIP_DB:
-        if not tech_allowed(d["tech"], tech_choice, include_unknown_tech):
-            continue
-        if not rarity_allowed(d["rarity"], rarity_mode, include_unknown_rarity):
-            continue
+# ---- Compiled table cache (LRU, keyed by normalized filters) ----
+ROLL_CACHE_SIZE = 32
+DB_INDEX_CACHE_SIZE = 8
 
-        if year is not None:
-            if d["year"] is None:
-                if strict_year:
-                    continue
-            else:
-                if d["year"] > year:
-                    continue
+_ROLL_CACHE = OrderedDict()
+_ROLL_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+_DB_GENERATION = 0
+_DB_INDEXES = OrderedDict()
 
-        pool.append(d)
-        pool_weights.append(RARITY_WEIGHT.get(d["rarity"], 1.0))
 
-    if not pool:
-        return "No candidates (filters too strict)."
+def invalidate_roll_cache():
+    """
+    Drop every cached roll table. Replacing DROPSHIP_DB, editing its rows,
+    editing RARITY_WEIGHT or poll_overrides() picking up an edited tuning
+    file is handled automatically; call this after editing rows of a plain
+    list-of-dicts DB in place.
+    """
+    global _DB_GENERATION
+    _DB_GENERATION += 1
+    _ROLL_CACHE.clear()
+    _SINGLE_DRAW_MISSES.clear()
+    _DB_INDEXES.clear()
+    _PRODUCTION_CURVES.clear()
+    _PRODUCTION_FACTORS.clear()
+
+
+def roll_cache_stats():
+    stats = dict(_ROLL_CACHE_STATS)
+    stats["size"] = len(_ROLL_CACHE)
+    stats["maxsize"] = ROLL_CACHE_SIZE
+    return stats
+
+
+def _dropship_version(db=None, weights=None):
+    if db is None:
+        db = _data("DROPSHIP_DB")
+    if weights is None:
+        weights = _data("RARITY_WEIGHT")
+    return (
+        _DB_GENERATION,
+        id(db),
+        len(db),
+        getattr(db, "generation", 0),
+        tuple(sorted(weights.items())),
+        _production_settings(),
+    )
+
+
+_DROPSHIP_INDEX = None
+
+
+def dropship_index():
+    """
+    YearIndex of ShipRoll records over DROPSHIP_DB, rebuilt whenever the DB
+    or weights change. Labels are rendered here, once per class.
+    """
+    global _DROPSHIP_INDEX
+    version = _dropship_version()
+    if _DROPSHIP_INDEX is None or _DROPSHIP_INDEX[0] != version:
+        if _STATS is not None:
+            _STATS.counters["index_builds"] += 1
+        weights = _data("RARITY_WEIGHT")
+        index = YearIndex(
+            _data("DROPSHIP_DB"),
+            lambda d: weights.get(d["rarity"], 1.0),
+            make_item=dropship_record,
+        )
+        _DROPSHIP_INDEX = (version, index)
+    return _DROPSHIP_INDEX[1]
+
+
+def _dropship_filter_key(tech_choice, year, strict_year, rarity_mode,
+                         include_unknown_rarity, include_unknown_tech):
+    # Collapse settings that cannot change the pool so equivalent
+    # filter sets share one cache slot. Only "Any" ignores
+    # include_unknown_tech; any other unrecognised tech_choice still
+    # matches just the Unknown-tech rows, as in tech_allowed().
+    if tech_choice == "Any":
+        include_unknown_tech = True
+    if rarity_mode not in ("common", "common_uncommon"):
+        rarity_mode = "any"
+    if year is None:
+        strict_year = False
+    return (tech_choice, year, bool(strict_year), rarity_mode,
+            bool(include_unknown_rarity), bool(include_unknown_tech))
+
+
+def get_dropship_table(
+    tech_choice="Any",
+    year=None,
+    strict_year=False,
+    rarity_mode="any",
+    include_unknown_rarity=True,
+    include_unknown_tech=True
+):
+    """
+    Cached compile_dropship_table(). Returns None if no class passes the filters.
+    """
+    key = _dropship_filter_key(tech_choice, year, strict_year, rarity_mode,
+                               include_unknown_rarity, include_unknown_tech)
+    return _cached_table(("dropship",) + key, _dropship_version(),
+                         lambda: compile_dropship_table(*key))
+
+
+def _cached_table(key, version, build):
+    """
+    LRU lookup shared by every roller. An entry is reused only while its
+    stored version still equals `version`; otherwise build() replaces it.
+    """
+    cached = _ROLL_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        _ROLL_CACHE.move_to_end(key)
+        _ROLL_CACHE_STATS["hits"] += 1
+        if _STATS is not None:
+            _STATS.counters["cache_hits"] += 1
+        return cached[1]
+
+    _ROLL_CACHE_STATS["misses"] += 1
+    if _STATS is not None:
+        start = time.perf_counter()
+        table = build()
+        _STATS.filter_time.add(time.perf_counter() - start)
+        counters = _STATS.counters
+        counters["cache_misses"] += 1
+        counters["pool_builds"] += 1
+        counters["candidates_considered"] += len(table.items) if table is not None else 0
+    else:
+        table = build()
+
+    _ROLL_CACHE[key] = (version, table)
+    _ROLL_CACHE.move_to_end(key)
+    while len(_ROLL_CACHE) > max(ROLL_CACHE_SIZE, 0):
+        _ROLL_CACHE.popitem(last=False)
+        _ROLL_CACHE_STATS["evictions"] += 1
+
+    return table
 
-    picked = weighted_choice(pool, pool_weights)
 
+# Single draws that miss the table cache are made straight off the
+# YearIndex; a filter set is compiled once it has been drawn from this often.
+SINGLE_DRAW_COMPILE_AFTER = 2
+_SINGLE_DRAW_MISSES = OrderedDict()
+
+
+_USE_TABLE = object()
+
+
+def _roll_one(key, version, rng, index_roll, build, args):
+    """
+    One draw for the filter set `key`. It comes from the set's compiled
+    table (build(*args), via the LRU) when that is cached or the set has
+    now been drawn from SINGLE_DRAW_COMPILE_AFTER times. Otherwise
+    index_roll(rng, *args) makes it with a bisect over the YearIndex
+    prefix sums, which neither copies the pool nor fills the LRU, so a
+    sweep over many cutoff years costs O(log n) per new year. Both ways
+    map the uniform draw by inverse CDF over the same pool, so a seeded
+    roll does not depend on what happens to be cached. index_roll returns
+    _USE_TABLE when only the table can answer (production curves).
+    """
+    cached = _ROLL_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        seen = _SINGLE_DRAW_MISSES.pop(key, 0) + 1
+        if seen < SINGLE_DRAW_COMPILE_AFTER:
+            picked = index_roll(rng, *args)
+            if picked is not _USE_TABLE:
+                _SINGLE_DRAW_MISSES[key] = seen
+                while len(_SINGLE_DRAW_MISSES) > max(ROLL_CACHE_SIZE, 0):
+                    _SINGLE_DRAW_MISSES.popitem(last=False)
+                return picked
+    table = _cached_table(key, version, lambda: build(*args))
+    return None if table is None else table.roll_cdf(rng)
+
+
+def format_dropship(picked):
     parts = [picked["name"]]
     if picked["year"] is not None:
         parts.append(f"(intro {picked['year']}, {era_for_year(picked['year'])})")
@@ -232,33 +909,505 @@ def roll_dropship(
     return " ".join(parts)
 
 
-def roll_many_dropships(n, **kwargs):
-    return [roll_dropship(**kwargs) for _ in range(n)]
+class ShipRoll(namedtuple("ShipRoll", "name year era tech rarity label")):
+    """
+    One rolled class, with era and display label worked out when the roll
+    table was built. str() gives the label.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return self.label
+
+
+def dropship_record(d):
+    year = d["year"]
+    return ShipRoll(
+        d["name"],
+        year,
+        era_for_year(year) if year is not None else None,
+        d["tech"],
+        d["rarity"],
+        format_dropship(d),
+    )
+
+
+def roll_dropship(
+    tech_choice="Any",
+    year=None,
+    strict_year=False,
+    rarity_mode="any",
+    include_unknown_rarity=True,
+    include_unknown_tech=True,
+    rng=None
+):
+    if not _data("DROPSHIP_DB"):
+        return "No DropShip data loaded. Run build_dropship_overrides.py first."
+
+    filters = (tech_choice, year, strict_year, rarity_mode,
+               include_unknown_rarity, include_unknown_tech)
+    if _STATS is not None:
+        picked = _STATS.sample("dropship", 1, _roll_one_dropship, rng or random, filters)
+    else:
+        picked = _roll_one_dropship(rng or random, filters)
+    if picked is None:
+        return "No candidates (filters too strict)."
+    return picked.label
+
+
+def _roll_one_dropship(rng, filters):
+    """One ShipRoll for the filters of compile_dropship_table(), or None."""
+    key = _dropship_filter_key(*filters)
+    return _roll_one(("dropship",) + key, _dropship_version(), rng,
+                     _roll_dropship_index, compile_dropship_table, key)
+
+
+def _roll_dropship_index(rng, tech_choice, year, strict_year, rarity_mode,
+                         include_unknown_rarity, include_unknown_tech):
+    if year is not None and production_factors(_data("DROPSHIP_DB"), year):
+        return _USE_TABLE
+    return dropship_index().roll(
+        _dropship_predicate(tech_choice, rarity_mode, include_unknown_rarity, include_unknown_tech),
+        max_year=year,
+        include_unknown_years=not strict_year,
+        rng=rng,
+    )
+
+
+def roll_dropship_record(rng=None, tech_choice="Any", year=None, strict_year=False,
+                         rarity_mode="any", include_unknown_rarity=True, include_unknown_tech=True):
+    """
+    Like roll_dropship() but returns a ShipRoll (name, year, era, tech,
+    rarity, label), or None if there is no data or no candidate.
+    """
+    if not _data("DROPSHIP_DB"):
+        return None
+    filters = (tech_choice, year, strict_year, rarity_mode,
+               include_unknown_rarity, include_unknown_tech)
+    if _STATS is not None:
+        return _STATS.sample("dropship", 1, _roll_one_dropship, rng or random, filters)
+    return _roll_one_dropship(rng or random, filters)
+
+
+def roll_many_dropships(n, rng=None, unique=False, **kwargs):
+    """
+    n DropShip labels. With unique=True every class appears at most once
+    (weighted draw without replacement); if fewer than n classes pass the
+    filters, all of them are returned.
+    """
+    if not _data("DROPSHIP_DB"):
+        return [roll_dropship(**kwargs) for _ in range(n)]
+
+    table = get_dropship_table(**kwargs)
+    if table is None:
+        return ["No candidates (filters too strict)."] * n
+
+    draw = table.sample_unique if unique else table.sample
+    if _STATS is not None:
+        return [r.label for r in _STATS.sample("dropship", n, draw, n, rng or random)]
+    return [r.label for r in draw(n, rng or random)]
+
+
+def iter_dropships(records=False, **kwargs):
+    """
+    Endless lazy stream of DropShip rolls: labels, or ShipRoll records with
+    records=True. The filtered pool is prepared once up front; memory stays
+    flat however many you take. Yields nothing if there is no data or no
+    class passes the filters.
+    """
+    if not _data("DROPSHIP_DB"):
+        return
+    table = get_dropship_table(**kwargs)
+    if table is None:
+        return
+
+    rolls = table.iter_rolls()
+    if _STATS is not None:
+        rolls = _STATS.stream("dropship", rolls)
+    if records:
+        yield from rolls
+    else:
+        for r in rolls:
+            yield r.label
 
 
-def audit_dropship_db():
+def roll_dropship_batch(n, labels=False, seed=None, **kwargs):
+    """
+    n DropShip rolls as indices into get_dropship_table(**kwargs).items (a
+    NumPy array when NumPy is installed; items are ShipRoll records), or
+    labels if labels=True.
+    Returns None if there is no data or no class passes the filters.
+    """
+    if not _data("DROPSHIP_DB"):
+        return None
+    table = get_dropship_table(**kwargs)
+    if table is None:
+        return None
+
+    if _STATS is not None:
+        idx = _STATS.sample("dropship", n, batch_indices, table, n, seed)
+    else:
+        idx = batch_indices(table, n, seed=seed)
+    if labels:
+        return indices_to_labels(idx, [r.label for r in table.items])
+    return idx
+
+
+def roll_dropship_counts(n, **kwargs):
+    """
+    {class name: count} for n DropShip rolls with the given filters. Cost
+    depends on the number of eligible classes, not on n. Returns None if
+    there is no data or no class passes the filters.
+    """
+    if not _data("DROPSHIP_DB"):
+        return None
+    table = get_dropship_table(**kwargs)
+    if table is None:
+        return None
+
+    if _STATS is not None:
+        counts = _STATS.sample("dropship", n, table.sample_counts, n)
+    else:
+        counts = table.sample_counts(n)
+    return {r.name: k for r, k in zip(table.items, counts) if k}
+
+
+# ---- Hot reload of the tuning files ----
+# poll_overrides() stats the three JSON files and, when one changed, redoes
+# only the classes whose override entry changed (base row + new override)
+# and re-weights only the rarities whose weight changed. Patched rows go
+# into a copy of the store, the index rebuilds just the affected
+# (tech, rarity) buckets and shares the rest, and cached tables whose
+# filters cannot reach an affected bucket are carried over. The new data is
+# published at the end; a table or stream a roller already holds keeps
+# rolling on the snapshot it was built from.
+
+OVERRIDE_POLL_INTERVAL_SEC = 1.0
+
+
+def _changed_keys(old, new):
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+def _patched_store(db, names, base_row, apply):
+    """
+    (store, keys, patched): a copy of `db` whose rows named in `names` are
+    rebuilt as apply(base_row(name)), the (tech, rarity) keys those rows
+    had before or have now, and the names actually patched. `db` itself
+    is returned when there is nothing to patch.
+    """
+    if not names:
+        return db, set(), []
+    store = db.copy() if isinstance(db, ShipStore) else ShipStore.from_rows(db)
+    position = {name: i for i, name in enumerate(store.names)}
+    keys = set()
+    patched = []
+    for name in sorted(names):
+        base = base_row(name) if name in position else None
+        if base is None:
+            continue
+        row = store[position[name]]
+        keys.add((row["tech"], row["rarity"]))
+        store.set_row(row.i, apply(base))
+        keys.add((row["tech"], row["rarity"]))
+        patched.append(name)
+    if not patched:
+        return db, set(), []
+    return store, keys, patched
+
+
+def _reload_dropship(local_overrides, weights, summary):
+    global _DROPSHIP_INDEX
+    old_db = _data("DROPSHIP_DB")
+    old_weights = _data("RARITY_WEIGHT")
+    names = _changed_keys(_data("LOCAL_OVERRIDES"), local_overrides)
+    rarities = _changed_keys(old_weights, weights)
+
+    base = _data("DROPSHIP_OVERRIDES") if names else {}
+    db, keys, patched = _patched_store(
+        old_db, names,
+        lambda name: _dropship_row(name, base[name]) if name in base else None,
+        lambda row: apply_overrides([row], local_overrides)[0],
+    )
+    summary["dropship_classes"] = patched
+
+    old_version = _dropship_version(old_db, old_weights)
+    version = _dropship_version(db, weights)
+    current = _DROPSHIP_INDEX
+    index = kept = None
+    dropped = []
+    if version != old_version and current is not None and current[0] == old_version:
+        keys |= {k for k in current[1].keys() if k[1] in rarities}
+        index = current[1].updated(db, keys, lambda d: weights.get(d["rarity"], 1.0))
+        summary["buckets_rebuilt"] += len(keys)
+        kept = []
+        for key, (v, table) in list(_ROLL_CACHE.items()):
+            if key[0] != "dropship" or v != old_version:
+                continue
+            predicate = _dropship_predicate(key[1], key[4], key[5], key[6])
+            if any(map(predicate, keys)):
+                dropped.append(key)
+            else:
+                kept.append((key, table))
+
+    globals().update(LOCAL_OVERRIDES=local_overrides, RARITY_WEIGHT=weights, DROPSHIP_DB=db)
+    if index is not None:
+        _DROPSHIP_INDEX = (version, index)
+        for key, table in kept:
+            if key in _ROLL_CACHE:
+                _ROLL_CACHE[key] = (version, table)
+        for key in dropped:
+            _ROLL_CACHE.pop(key, None)
+        summary["tables_kept"] += len(kept)
+        summary["tables_dropped"] += len(dropped)
+
+
+def _reload_primitive(overrides, weights, summary):
+    old_db = _data("PRIMITIVE_JUMPSHIP_DB")
+    old_weights = _data("PRIMITIVE_RARITY_WEIGHTS")
+    names = _changed_keys(_data("PRIMITIVE_JS_OVERRIDES"), overrides)
+    rarities = _changed_keys(old_weights, weights)
+
+    base = {d["name"]: d for d in _primitive_base_rows()} if names else {}
+    db, keys, patched = _patched_store(
+        old_db, names,
+        lambda name: dict(base[name]) if name in base else None,
+        lambda row: _apply_primitive_overrides([row], overrides)[0],
+    )
+    summary["primitive_classes"] = patched
+
+    # Every cached index over the old DB moves to the new one; the index
+    # built with the primitive weights also takes the new weights.
+    old_weight_key = tuple(sorted(old_weights.items()))
+    moved = {}
+    for key, (cached_db, index) in list(_DB_INDEXES.items()):
+        if cached_db is not old_db:
+            continue
+        w = weights if key[3] == old_weight_key else dict(key[3])
+        affected = set(keys)
+        if w is weights:
+            affected |= {k for k in index.keys() if k[1] in rarities}
+        if db is old_db and not affected:
+            continue
+        new_key = (id(db), len(db), db.generation, tuple(sorted(w.items())))
+        new_index = index.updated(db, affected, lambda d, w=w: w.get(d.get("rarity", "unknown"), 1.0))
+        moved[id(index)] = (index, new_key, new_index, affected)
+        summary["buckets_rebuilt"] += len(affected)
+
+    carried = []
+    dropped = []
+    for key, (v, table) in list(_ROLL_CACHE.items()):
+        entry = moved.get(key[1]) if key[0] == "db" else None
+        if entry is None or v is not entry[0]:
+            continue
+        predicate = _db_predicate(key[5], key[6])
+        if any(predicate is None or predicate(k) for k in entry[3]):
+            dropped.append(key)
+        else:
+            carried.append((key, ("db", id(entry[2])) + key[2:], entry[2], table))
+
+    for _, new_key, new_index, _ in moved.values():
+        _DB_INDEXES[new_key] = (db, new_index)
+    while len(_DB_INDEXES) > max(DB_INDEX_CACHE_SIZE, 0):
+        _DB_INDEXES.popitem(last=False)
+    for old_key, new_key, new_index, table in carried:
+        if _ROLL_CACHE.pop(old_key, None) is not None:
+            _ROLL_CACHE[new_key] = (new_index, table)
+    for key in dropped:
+        _ROLL_CACHE.pop(key, None)
+    summary["tables_kept"] += len(carried)
+    summary["tables_dropped"] += len(dropped)
+    globals().update(PRIMITIVE_JS_OVERRIDES=overrides, PRIMITIVE_RARITY_WEIGHTS=weights,
+                     PRIMITIVE_JUMPSHIP_DB=db)
+
+
+def poll_overrides(force=False):
+    """
+    Reload the tuning files that changed on disk (by mtime and size; all of
+    them with force=True) and patch the loaded data instead of rebuilding
+    it. Returns None if nothing changed or the ship data is not loaded yet
+    (the first load reads the files anyway), else a summary dict: files,
+    dropship_classes / primitive_classes (names re-applied),
+    buckets_rebuilt, tables_kept, tables_dropped, plus error if a file
+    could not be read, in which case the previous data stays in use.
+
+    Three stat() calls when nothing changed, so it is fine to call before
+    every batch. Safe to call from several threads (watch_overrides(), the
+    roll server, an interactive loop): passes are serialised by a module
+    lock, so a second caller waits and then sees the files unchanged.
+    """
+    if "DROPSHIP_DB" not in globals():
+        return None
+    with _RELOAD_LOCK:
+        paths = [p for p in _tuning_paths() if force or _file_stamp(p) != _TUNING_STAMPS.get(p)]
+        if not paths:
+            return None
+
+        stamps = {p: _file_stamp(p) for p in paths}
+        summary = {
+            "files": [os.path.basename(p) for p in paths],
+            "dropship_classes": [],
+            "primitive_classes": [],
+            "buckets_rebuilt": 0,
+            "tables_kept": 0,
+            "tables_dropped": 0,
+        }
+        try:
+            data = _load_tuning_data(paths)
+        except (OSError, ValueError) as e:
+            _TUNING_STAMPS.update(stamps)
+            summary["error"] = str(e)
+            return summary
+        _TUNING_STAMPS.update(stamps)
+
+        _reload_dropship(data.get("LOCAL_OVERRIDES", _data("LOCAL_OVERRIDES")),
+                         data.get("RARITY_WEIGHT", _data("RARITY_WEIGHT")), summary)
+        _reload_primitive(data.get("PRIMITIVE_JS_OVERRIDES", _data("PRIMITIVE_JS_OVERRIDES")),
+                          data.get("PRIMITIVE_RARITY_WEIGHTS", _data("PRIMITIVE_RARITY_WEIGHTS")),
+                          summary)
+        return summary
+
+
+def format_override_reload(summary):
+    files = ", ".join(summary["files"])
+    if "error" in summary:
+        return f"Could not reload {files}: {summary['error']} (keeping the previous data)"
+    return (
+        f"Reloaded {files}: {len(summary['dropship_classes'])} DropShip and "
+        f"{len(summary['primitive_classes'])} Primitive JumpShip classes, "
+        f"{summary['buckets_rebuilt']} buckets rebuilt, "
+        f"{summary['tables_kept']} cached tables kept, {summary['tables_dropped']} dropped."
+    )
+
+
+def watch_overrides(interval=OVERRIDE_POLL_INTERVAL_SEC, on_reload=None):
+    """
+    Run poll_overrides() every `interval` seconds on a daemon thread and
+    pass each summary to on_reload (default: print it to stderr). Returns
+    a threading.Event; set() it to stop watching.
+    """
+    stop = threading.Event()
+
+    def report(summary):
+        print(format_override_reload(summary), file=sys.stderr)
+
+    def run():
+        while not stop.wait(interval):
+            summary = poll_overrides()
+            if summary is not None:
+                (on_reload or report)(summary)
+
+    threading.Thread(target=run, name="override-watcher", daemon=True).start()
+    return stop
+
+
+# ---- Provenance (cold data, loaded only on request) ----
+# dropship_overrides.py only carries year/tech/rarity. Evidence and source
+# links stay in the builder's JSON and are read the first time something
+# asks for them.
+
+DROPSHIP_PROVENANCE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "dropship_overrides.json"
+)
+PROVENANCE_FIELDS = ("evidence", "source_title", "source_url")
+
+_PROVENANCE = None
+
+
+def load_dropship_provenance():
+    """{class name: {evidence, source_title, source_url}}; {} if the JSON is missing."""
+    global _PROVENANCE
+    if _PROVENANCE is None:
+        import json
+
+        try:
+            with open(DROPSHIP_PROVENANCE_PATH, encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            raw = {}
+        _PROVENANCE = {
+            name: {k: data.get(k) for k in PROVENANCE_FIELDS}
+            for name, data in raw.items()
+        }
+    return _PROVENANCE
+
+
+def explain_dropship_rarity(name):
+    """Lines explaining where a DropShip class's rarity comes from."""
+    row = next((d for d in _data("DROPSHIP_DB") if d["name"] == name), None)
+    if row is None:
+        return [f"{name}: not in the DropShip DB."]
+
+    rarity = row["rarity"]
+    lines = [f"{name}: {rarity} (weight {_data('RARITY_WEIGHT').get(rarity, 1.0)})"]
+
+    info = load_dropship_provenance().get(name, {})
+    if _data("LOCAL_OVERRIDES").get(name, {}).get("rarity") is not None:
+        lines.append(f"Set in {os.path.basename(LOCAL_OVERRIDES_PATH)}.")
+    elif info.get("evidence"):
+        lines.append("Guessed from article wording:")
+        lines.extend(f"  {e}" for e in info["evidence"])
+    else:
+        lines.append("No rarity wording found on Sarna; treated as unknown.")
+
+    if info.get("source_url"):
+        lines.append(f"Source: {info['source_url']}")
+    return lines
+
+
+def dropship_audit_summary(provenance=False):
+    """Data-coverage counts behind audit_dropship_db(), as a dict."""
     rarity_counts = {}
     tech_counts = {}
     missing_year = 0
 
-    for d in DROPSHIP_DB:
+    db = _data("DROPSHIP_DB")
+    for d in db:
         rarity_counts[d["rarity"]] = rarity_counts.get(d["rarity"], 0) + 1
         tech_counts[d["tech"]] = tech_counts.get(d["tech"], 0) + 1
         if d["year"] is None:
             missing_year += 1
 
-    print(f"Total classes in DB: {len(DROPSHIP_DB)}")
-    print(f"Overrides loaded: {len(DROPSHIP_OVERRIDES)}")
-    print(f"Missing intro year: {missing_year}")
-    print("Tech counts:", tech_counts)
-    print("Rarity counts:", rarity_counts)
+    summary = {
+        "total_classes": len(db),
+        "overrides_loaded": len(_data("DROPSHIP_OVERRIDES")),
+        "missing_year": missing_year,
+        "tech_counts": tech_counts,
+        "rarity_counts": rarity_counts,
+    }
+
+    if provenance:
+        info = load_dropship_provenance()
+        summary["rarity_from_evidence"] = sum(
+            1 for d in db if info.get(d["name"], {}).get("evidence"))
+        summary["rarity_from_local_overrides"] = sum(
+            1 for d in db if _data("LOCAL_OVERRIDES").get(d["name"], {}).get("rarity") is not None)
+        summary["missing_source"] = sum(
+            1 for d in db if not info.get(d["name"], {}).get("source_url"))
+    return summary
+
+
+def audit_dropship_db(provenance=False):
+    summary = dropship_audit_summary(provenance)
+
+    print(f"Total classes in DB: {summary['total_classes']}")
+    print(f"Overrides loaded: {summary['overrides_loaded']}")
+    print(f"Missing intro year: {summary['missing_year']}")
+    print("Tech counts:", summary["tech_counts"])
+    print("Rarity counts:", summary["rarity_counts"])
+
+    if provenance:
+        print(f"Rarity backed by article wording: {summary['rarity_from_evidence']}")
+        print(f"Rarity set by LOCAL_OVERRIDES: {summary['rarity_from_local_overrides']}")
+        print(f"Missing source link: {summary['missing_source']}")
 
 
 def interactive_dropship_roller():
     print("DropShip Class Roller (weighted)")
     print("Type 'q' at any prompt to quit.\n")
 
-    if not DROPSHIP_DB:
+    if not _data("DROPSHIP_DB"):
         print("No DropShip data loaded.")
         print("Run build_dropship_overrides.py (F5) to generate dropship_overrides.py, then run this again.\n")
         return
@@ -329,6 +1478,20 @@ def interactive_dropship_roller():
     else:
         include_unknown_rarity = True
 
+    filters = dict(
+        tech_choice=tech_choice,
+        year=year,
+        strict_year=strict_year,
+        rarity_mode=rarity_mode,
+        include_unknown_rarity=include_unknown_rarity,
+        include_unknown_tech=include_unknown_tech,
+    )
+    if get_dropship_table(**filters) is None:
+        print("No candidates (filters too strict).\n")
+        return
+
+    rolls = iter_dropships(**filters)
+
     print("\n--- Ready ---\n")
 
     while True:
@@ -346,17 +1509,13 @@ def interactive_dropship_roller():
             print("Please enter a whole number (e.g., 1, 5, 20) or 'q' to quit.\n")
             continue
 
-        results = roll_many_dropships(
-            n,
-            tech_choice=tech_choice,
-            year=year,
-            strict_year=strict_year,
-            rarity_mode=rarity_mode,
-            include_unknown_rarity=include_unknown_rarity,
-            include_unknown_tech=include_unknown_tech,
-        )
+        reload = poll_overrides()
+        if reload is not None:
+            print(format_override_reload(reload))
+            if "error" not in reload:
+                rolls = iter_dropships(**filters)
 
-        for i, cls in enumerate(results, start=1):
+        for i, cls in enumerate(islice(rolls, n), start=1):
             print(f"DS-{i:02d}: {cls}")
         print()
 
@@ -370,18 +1529,35 @@ def interactive_dropship_roller():
 # Primitive JumpShip roller
 # =============================
 
-# Safe import: roller still runs even if you haven't created primitive_jumpships.py yet
-try:
-    from primitive_jumpships import PRIMITIVE_JUMPSHIP_DB, PRIMITIVE_RARITY_WEIGHTS
-except Exception:
-    PRIMITIVE_JUMPSHIP_DB = []
-    PRIMITIVE_RARITY_WEIGHTS = {
-        "common": 1.0,
-        "uncommon": 0.6,
-        "rare": 0.25,
-        "very_rare": 0.01,
-        "unknown": 0.5,
-    }
+DEFAULT_PRIMITIVE_RARITY_WEIGHTS = {
+    "common": 1.0,
+    "uncommon": 0.6,
+    "rare": 0.25,
+    "very_rare": 0.01,
+    "unknown": 0.5,
+}
+
+
+def _primitive_base_rows():
+    # Safe import: roller still runs even if you haven't created primitive_jumpships.py yet
+    try:
+        from primitive_jumpships import PRIMITIVE_JUMPSHIP_DB
+    except Exception:
+        PRIMITIVE_JUMPSHIP_DB = []
+    return PRIMITIVE_JUMPSHIP_DB
+
+
+def _apply_primitive_overrides(db, overrides):
+    try:
+        from primitive_jumpships import apply_primitive_overrides
+    except Exception:
+        return db
+    return apply_primitive_overrides(db, overrides)
+
+
+def _load_primitive_db(overrides):
+    """PRIMITIVE_JUMPSHIP_DB rows (copied) with `overrides` applied."""
+    return _apply_primitive_overrides([dict(d) for d in _primitive_base_rows()], overrides)
 
 
 def _prompt_int(prompt, allow_blank=False):
@@ -409,39 +1585,245 @@ def _prompt_yes_no(prompt, default=True):
     return raw in ("y", "yes")
 
 
-def roll_from_db(db, *, max_year=None, include_unknown_years=True,
+def _index_for_db(db, rarity_weights):
+    """
+    YearIndex for an arbitrary ship DB (e.g. PRIMITIVE_JUMPSHIP_DB), cached
+    by DB identity, length and weights. Call invalidate_roll_cache() after
+    editing rows in place.
+    """
+    key = (id(db), len(db), getattr(db, "generation", 0),
+           tuple(sorted(rarity_weights.items())))
+    cached = _DB_INDEXES.get(key)
+    if cached is not None and cached[0] is db:
+        _DB_INDEXES.move_to_end(key)
+        return cached[1]
+
+    if _STATS is not None:
+        _STATS.counters["index_builds"] += 1
+    index = YearIndex(db, lambda d: rarity_weights.get(d.get("rarity", "unknown"), 1.0))
+    _DB_INDEXES[key] = (db, index)
+    while len(_DB_INDEXES) > max(DB_INDEX_CACHE_SIZE, 0):
+        _DB_INDEXES.popitem(last=False)
+    return index
+
+
+def _db_predicate(allowed_tech, allowed_rarities):
+    if not allowed_tech and not allowed_rarities:
+        return None
+
+    def predicate(key):
+        return ((not allowed_tech or key[0] in allowed_tech)
+                and (not allowed_rarities or key[1] in allowed_rarities))
+    return predicate
+
+
+def _db_table_key(db, max_year, include_unknown_years, allowed_tech, allowed_rarities,
+                  rarity_weights):
+    """(LRU key, YearIndex) for a roll_from_db() filter set."""
+    index = _index_for_db(db, rarity_weights)
+    key = (
+        "db",
+        id(index),
+        _production_settings(),
+        max_year,
+        max_year is None or bool(include_unknown_years),
+        frozenset(allowed_tech) if allowed_tech else None,
+        frozenset(allowed_rarities) if allowed_rarities else None,
+    )
+    return key, index
+
+
+def get_db_table(db, *, max_year=None, include_unknown_years=True,
                  allowed_tech=None, allowed_rarities=None, rarity_weights=None):
-    candidates = []
-    weights = []
+    """
+    roll_from_db() filters compiled into a RollTable over rows of `db`,
+    kept in the same LRU as the DropShip tables. Returns None if nothing
+    passes.
+    """
     rarity_weights = rarity_weights or {}
+    key, index = _db_table_key(db, max_year, include_unknown_years, allowed_tech,
+                               allowed_rarities, rarity_weights)
+    # The entry holds the index itself as its version, which also keeps
+    # id(index) from being reused while the entry is alive.
+    return _cached_table(key, index, lambda: compile_db_table(
+        db,
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        allowed_tech=allowed_tech,
+        allowed_rarities=allowed_rarities,
+        rarity_weights=rarity_weights,
+    ))
+
+
+def _db_pool(db, max_year, include_unknown_years, allowed_tech, allowed_rarities, rarity_weights):
+    """(rows, weights) of `db` passing the filters, production curves applied."""
+    index = _index_for_db(db, rarity_weights or {})
+    items, weights = index.candidates(
+        _db_predicate(allowed_tech, allowed_rarities),
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+    )
+    return _apply_production_curves(items, weights, db, max_year, lambda d: d["name"])
+
+
+def compile_db_table(db, *, max_year=None, include_unknown_years=True,
+                     allowed_tech=None, allowed_rarities=None, rarity_weights=None):
+    """Uncached get_db_table()."""
+    items, weights = _db_pool(db, max_year, include_unknown_years,
+                              allowed_tech, allowed_rarities, rarity_weights)
+    if not items or sum(weights) <= 0:
+        return None
+    return RollTable(items, weights)
 
-    for d in db:
-        if allowed_tech and d.get("tech") not in allowed_tech:
-            continue
-        if allowed_rarities and d.get("rarity") not in allowed_rarities:
-            continue
 
-        if max_year is not None:
-            y = d.get("year")
-            if y is None and not include_unknown_years:
-                continue
-            if y is not None and y > max_year:
-                continue
+def roll_from_db(db, *, max_year=None, include_unknown_years=True,
+                 allowed_tech=None, allowed_rarities=None, rarity_weights=None, rng=None,
+                 n=None, unique=False):
+    """
+    One weighted pick (a row of `db`) passing the filters, or None.
 
-        candidates.append(d)
-        weights.append(rarity_weights.get(d.get("rarity", "unknown"), 1.0))
+    With n=N, a list of N picks instead; unique=True makes them distinct
+    classes (weighted draw without replacement), returning all eligible
+    classes if there are fewer than N.
 
-    if not candidates:
+    A one-off single pick is a bisect over the DB's YearIndex (see
+    _roll_one()); n picks go through the cached compiled table.
+    """
+    if n is None:
+        if _STATS is not None:
+            return _STATS.sample("db", 1, _roll_one_from_db, rng or random, db, max_year,
+                                 include_unknown_years, allowed_tech, allowed_rarities,
+                                 rarity_weights)
+        return _roll_one_from_db(rng or random, db, max_year, include_unknown_years,
+                                 allowed_tech, allowed_rarities, rarity_weights)
+
+    table = get_db_table(
+        db,
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        allowed_tech=allowed_tech,
+        allowed_rarities=allowed_rarities,
+        rarity_weights=rarity_weights,
+    )
+    if table is None:
         return None
+    draw = table.sample_unique if unique else table.sample
+    if _STATS is not None:
+        return _STATS.sample("db", n, draw, n, rng or random)
+    return draw(n, rng or random)
+
+
+def _roll_one_from_db(rng, db, max_year, include_unknown_years,
+                      allowed_tech, allowed_rarities, rarity_weights):
+    rarity_weights = rarity_weights or {}
+    key, index = _db_table_key(db, max_year, include_unknown_years, allowed_tech,
+                               allowed_rarities, rarity_weights)
+    return _roll_one(key, index, rng, _roll_db_index, _compile_db_table_args,
+                     (db, max_year, include_unknown_years, allowed_tech, allowed_rarities,
+                      rarity_weights))
+
+
+def _roll_db_index(rng, db, max_year, include_unknown_years, allowed_tech, allowed_rarities,
+                   rarity_weights):
+    if max_year is not None and production_factors(db, max_year):
+        return _USE_TABLE
+    return _index_for_db(db, rarity_weights).roll(
+        _db_predicate(allowed_tech, allowed_rarities),
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        rng=rng,
+    )
+
+
+def _compile_db_table_args(db, max_year, include_unknown_years, allowed_tech, allowed_rarities,
+                           rarity_weights):
+    return compile_db_table(
+        db,
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        allowed_tech=allowed_tech,
+        allowed_rarities=allowed_rarities,
+        rarity_weights=rarity_weights,
+    )
+
+
+def roll_from_db_counts(db, n, *, max_year=None, include_unknown_years=True,
+                        allowed_tech=None, allowed_rarities=None, rarity_weights=None):
+    """
+    {class name: count} for n roll_from_db() rolls, O(classes) instead of O(n).
+    Returns None if nothing passes the filters.
+    """
+    table = get_db_table(
+        db,
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        allowed_tech=allowed_tech,
+        allowed_rarities=allowed_rarities,
+        rarity_weights=rarity_weights,
+    )
+    if table is None:
+        return None
+
+    if _STATS is not None:
+        counts = _STATS.sample("db", n, table.sample_counts, n)
+    else:
+        counts = table.sample_counts(n)
+    return {d["name"]: k for d, k in zip(table.items, counts) if k}
+
 
-    return random.choices(candidates, weights=weights, k=1)[0]
+def format_primitive_jumpship(pick):
+    label = pick["name"]
+    if pick.get("year") is not None:
+        label += f" (intro {pick['year']})"
+    label += f" [{pick.get('rarity', 'unknown')}]"
+    return label
+
+
+def iter_primitive_jumpships(db=None, *, max_year=None, include_unknown_years=True,
+                             allowed_tech=None, allowed_rarities=None, rarity_weights=None,
+                             labels=False):
+    """
+    Endless lazy stream of roll_from_db() picks (rows of `db`, default
+    PRIMITIVE_JUMPSHIP_DB with PRIMITIVE_RARITY_WEIGHTS), or of their
+    display labels with labels=True. The pool and its labels are compiled
+    once per filter set and kept in the roll-table LRU.
+    Yields nothing if no class passes the filters.
+    """
+    if db is None:
+        db = _data("PRIMITIVE_JUMPSHIP_DB")
+        if rarity_weights is None:
+            rarity_weights = _data("PRIMITIVE_RARITY_WEIGHTS")
+    table = get_db_table(
+        db,
+        max_year=max_year,
+        include_unknown_years=include_unknown_years,
+        allowed_tech=allowed_tech,
+        allowed_rarities=allowed_rarities,
+        rarity_weights=rarity_weights,
+    )
+    if table is None:
+        return
+
+    if labels:
+        # Labelled copy of the pool, cached beside the filter table under
+        # the same key and version so repeat calls neither re-format rows
+        # nor rebuild the alias table.
+        key, index = _db_table_key(db, max_year, include_unknown_years, allowed_tech,
+                                   allowed_rarities, rarity_weights or {})
+        pool = table
+        table = _cached_table(key + ("labels",), index, lambda: RollTable(
+            [format_primitive_jumpship(d) for d in pool.items], pool.weights))
+    if _STATS is not None:
+        yield from _STATS.stream("db", table.iter_rolls())
+    else:
+        yield from table.iter_rolls()
 
 
 def interactive_primitive_jumpship_roller():
     print("Primitive JumpShip Roller")
     print("Type 'q' at any prompt to quit.\n")
 
-    if not PRIMITIVE_JUMPSHIP_DB:
+    if not _data("PRIMITIVE_JUMPSHIP_DB"):
         print("No Primitive JumpShip data loaded.")
         print("Make sure primitive_jumpships.py is in the same folder and defines PRIMITIVE_JUMPSHIP_DB.\n")
         return
@@ -465,23 +1847,24 @@ def interactive_primitive_jumpship_roller():
             print("Please enter a positive integer.\n")
             continue
 
-        for i in range(1, n + 1):
-            pick = roll_from_db(
-                PRIMITIVE_JUMPSHIP_DB,
-                max_year=max_year,
-                include_unknown_years=include_unknown,
-                # NOTE: Do NOT restrict tech here unless your DB reliably has "tech": "IS" on every row
-                rarity_weights=PRIMITIVE_RARITY_WEIGHTS,
-            )
-            if pick is None:
-                print("No matching classes found with the current filters.")
-                break
-
-            label = pick["name"]
-            if pick.get("year") is not None:
-                label += f" (intro {pick['year']})"
-            label += f" [{pick.get('rarity', 'unknown')}]"
+        reload = poll_overrides()
+        if reload is not None:
+            print(format_override_reload(reload))
+
+        rolls = iter_primitive_jumpships(
+            _data("PRIMITIVE_JUMPSHIP_DB"),
+            max_year=max_year,
+            include_unknown_years=include_unknown,
+            # NOTE: Do NOT restrict tech here unless your DB reliably has "tech": "IS" on every row
+            rarity_weights=_data("PRIMITIVE_RARITY_WEIGHTS"),
+            labels=True,
+        )
+        picked_any = False
+        for i, label in enumerate(islice(rolls, n), start=1):
+            picked_any = True
             print(f"PJS-{i:02d}: {label}")
+        if not picked_any:
+            print("No matching classes found with the current filters.")
         print()
 
         again = _prompt_yes_no("Roll again? (y/n): ", default=False)
@@ -490,14 +1873,353 @@ def interactive_primitive_jumpship_roller():
             return
 
 
+# ============================================================
+# Exact probability tables
+# ============================================================
+
+def _normalize(names, weights):
+    total = float(sum(weights))
+    if total <= 0:
+        return {}
+    probs = {}
+    for name, w in zip(names, weights):
+        probs[name] = probs.get(name, 0.0) + w / total
+    return probs
+
+
+def expected_counts(probabilities, n):
+    """{class: expected count} for n rolls, from any *_probabilities() result."""
+    return {name: p * n for name, p in probabilities.items()}
+
+
+def jumpship_probabilities():
+    """
+    Exact per-class odds of roll_jumpship(), with the d6 minor bucket
+    folded in (e.g. Tramp = 3% x 2/6 = 1%).
+    """
+    return _normalize(JUMPSHIP_TABLE.items, JUMPSHIP_TABLE.weights)
+
+
+def dropship_probabilities(
+    tech_choice="Any",
+    year=None,
+    strict_year=False,
+    rarity_mode="any",
+    include_unknown_rarity=True,
+    include_unknown_tech=True
+):
+    """
+    Exact {class name: probability} for roll_dropship() with these filters,
+    straight from RARITY_WEIGHT and the production curves. Empty if no
+    class passes.
+    """
+    pool, weights = _dropship_pool(
+        tech_choice, year, strict_year, rarity_mode,
+        include_unknown_rarity, include_unknown_tech,
+    )
+    return _normalize([r.name for r in pool], weights)
+
+
+def dropship_probability_sweep(years, **kwargs):
+    """
+    {year: {class name: probability}} for every year in `years`, e.g.
+    range(2005, 3151). Each year is one pass over the index prefixes; the
+    roll cache is left alone.
+    """
+    return {y: dropship_probabilities(year=y, **kwargs) for y in years}
+
+
+def db_probabilities(db, *, max_year=None, include_unknown_years=True,
+                     allowed_tech=None, allowed_rarities=None, rarity_weights=None):
+    """Exact {class name: probability} for roll_from_db() with these filters."""
+    items, weights = _db_pool(db, max_year, include_unknown_years,
+                              allowed_tech, allowed_rarities, rarity_weights)
+    return _normalize([d["name"] for d in items], weights)
+
+
+# ============================================================
+# Seeded / parallel rolling
+# ============================================================
+
+PARALLEL_SHARD_SIZE = 50_000
+
+
+# The DB a "db" roll_parallel() run rolls from: handed to each worker once
+# by the pool initializer rather than pickled into every shard task.
+_SHARD_DB = None
+
+
+def _init_shard_db(db):
+    global _SHARD_DB
+    _SHARD_DB = db
+
+
+def _roll_shard(kind, count, seed, shard, kwargs):
+    """
+    Roll one shard with its own RNG stream. Runs in a worker process, so it
+    only touches module-level data and its arguments. A "db" shard draws
+    batch_indices() from the compiled table of _SHARD_DB (cached per
+    worker) and returns the picks as plain dicts, which is also what a
+    ShipRow turns into when a worker pickles it.
+    """
+    rng = spawn_rng(seed, shard)
+    if kind == "jumpship":
+        return roll_many_jumpships(count, rng=rng)
+    if kind == "dropship":
+        return roll_many_dropships(count, rng=rng, **kwargs)
+    if kind == "db":
+        table = get_db_table(_SHARD_DB, **kwargs)
+        if table is None:
+            return [None] * count
+        items = table.items
+        return [dict(items[i]) for i in batch_indices(table, count, rng.getrandbits(64))]
+    raise ValueError(f"unknown roll kind: {kind!r}")
+
+
+def roll_parallel(kind, n, seed, workers=None, shard_size=PARALLEL_SHARD_SIZE, **kwargs):
+    """
+    n seeded rolls of `kind` ("jumpship", "dropship" or "db"), sharded
+    across a ProcessPoolExecutor.
+
+    Shard i always covers rolls [i * shard_size, (i + 1) * shard_size) and
+    uses spawn_rng(seed, i), so the merged list is bit-identical for any
+    worker count (workers=1 runs in-process), "db" rows as plain dicts
+    either way. kwargs are the filters of
+    roll_dropship / roll_from_db; for "db" pass db=... (default
+    PRIMITIVE_JUMPSHIP_DB), which is sent to each worker process once.
+    Edits to other module globals such as RARITY_WEIGHT are only seen by
+    workers on platforms that fork.
+    """
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    if kwargs.get("unique"):
+        raise ValueError("unique=True draws cannot be split into shards")
+
+    db = None
+    if kind == "db":
+        kwargs = dict(kwargs)
+        db = kwargs.pop("db", None)
+        if db is None:
+            db = _data("PRIMITIVE_JUMPSHIP_DB")
+            kwargs.setdefault("rarity_weights", _data("PRIMITIVE_RARITY_WEIGHTS"))
+
+    shards = []
+    start = 0
+    while start < n:
+        count = min(shard_size, n - start)
+        shards.append((kind, count, seed, len(shards), kwargs))
+        start += count
+
+    if workers == 1 or len(shards) <= 1:
+        _init_shard_db(db)
+        try:
+            parts = [_roll_shard(*args) for args in shards]
+        finally:
+            _init_shard_db(None)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_shard_db,
+                                 initargs=(db,)) as pool:
+            parts = list(pool.map(_roll_shard, *zip(*shards)))
+
+    results = []
+    for part in parts:
+        results.extend(part)
+    return results
+
+
+# ============================================================
+# Batch CLI (non-interactive)
+# ============================================================
+
+OUTPUT_BUFFER_BYTES = 1 << 20
+CLI_CHUNK_ROLLS = 65536
+
+
+def _render_rows(records, fmt):
+    """
+    Pre-render one output line (bytes) per table row, plus an optional
+    header. Rolling then only joins pre-built bytes.
+    """
+    import csv
+    import io
+    import json
+
+    if fmt == "jsonl":
+        rows = [json.dumps(r, ensure_ascii=False) + "\n" for r in records]
+        return None, [r.encode("utf-8") for r in rows]
+
+    if fmt == "csv":
+        fields = list(records[0].keys())
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        header = buf.getvalue().encode("utf-8")
+        rows = []
+        for r in records:
+            buf.seek(0)
+            buf.truncate()
+            writer.writerow(r)
+            rows.append(buf.getvalue().encode("utf-8"))
+        return header, rows
+
+    return None, [(r["label"] + "\n").encode("utf-8") for r in records]
+
+
+def _jumpship_records(table):
+    return [{"name": label, "label": label} for label in table.items]
+
+
+def _dropship_records(table):
+    return [r._asdict() for r in table.items]
+
+
+def _primitive_records(table):
+    return [
+        {
+            "name": d["name"],
+            "year": d.get("year"),
+            "tech": d.get("tech"),
+            "rarity": d.get("rarity", "unknown"),
+            "label": format_primitive_jumpship(d),
+        }
+        for d in table.items
+    ]
+
+
+def write_rolls(out, table, records, n, fmt="text", seed=None):
+    """Write n rolls from `table` to the binary stream `out`."""
+    header, rows = _render_rows(records, fmt)
+    if header:
+        out.write(header)
+    for chunk in iter_index_chunks(table, n, CLI_CHUNK_ROLLS, seed=seed):
+        out.write(b"".join([rows[i] for i in chunk]))
+
+
+def _build_arg_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="BattleTech ship rollers. Run with no arguments for the interactive menu."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p):
+        p.add_argument("-n", type=int, default=1, help="number of rolls (default 1)")
+        p.add_argument("--format", choices=("text", "jsonl", "csv"), default="text")
+        p.add_argument("-o", "--output", help="output file (default stdout)")
+        p.add_argument("--seed", type=int, help="seed for a repeatable run")
+        p.add_argument("--stats", action="store_true",
+                       help="print roller stats to stderr when done")
+
+    add_common(sub.add_parser("jumpship", help="roll JumpShips (d100 table)"))
+
+    p = sub.add_parser("dropship", help="roll DropShips")
+    add_common(p)
+    p.add_argument("--tech", choices=("IS", "Clan", "Any"), default="Any")
+    p.add_argument("--exclude-unknown-tech", action="store_true")
+    p.add_argument("--year", type=int, help="chronology cutoff (in-universe year)")
+    p.add_argument("--strict-year", action="store_true",
+                   help="exclude designs with unknown intro year")
+    p.add_argument("--rarity", choices=("any", "common", "common_uncommon"), default="any")
+    p.add_argument("--exclude-unknown-rarity", action="store_true")
+
+    p = sub.add_parser("primitive", help="roll Primitive JumpShips")
+    add_common(p)
+    p.add_argument("--max-year", type=int, help="max intro year")
+    p.add_argument("--exclude-unknown-years", action="store_true")
+
+    return parser
+
+
+def run_cli(argv):
+    args = _build_arg_parser().parse_args(argv)
+    if args.n < 0:
+        print("-n must be zero or positive.", file=sys.stderr)
+        return 2
+    if args.stats:
+        enable_roller_stats()
+
+    if args.command == "jumpship":
+        table = JUMPSHIP_TABLE
+        records = _jumpship_records(table)
+
+    elif args.command == "dropship":
+        if not _data("DROPSHIP_DB"):
+            print("No DropShip data loaded. Run build_dropship_overrides.py first.", file=sys.stderr)
+            return 1
+        table = get_dropship_table(
+            tech_choice=args.tech,
+            year=args.year,
+            strict_year=args.strict_year,
+            rarity_mode=args.rarity,
+            include_unknown_rarity=not args.exclude_unknown_rarity,
+            include_unknown_tech=not args.exclude_unknown_tech,
+        )
+        if table is None:
+            print("No candidates (filters too strict).", file=sys.stderr)
+            return 1
+        records = _dropship_records(table)
+
+    else:
+        if not _data("PRIMITIVE_JUMPSHIP_DB"):
+            print("No Primitive JumpShip data loaded.", file=sys.stderr)
+            return 1
+        table = get_db_table(
+            _data("PRIMITIVE_JUMPSHIP_DB"),
+            max_year=args.max_year,
+            include_unknown_years=not args.exclude_unknown_years,
+            rarity_weights=_data("PRIMITIVE_RARITY_WEIGHTS"),
+        )
+        if table is None:
+            print("No matching classes found with the current filters.", file=sys.stderr)
+            return 1
+        records = _primitive_records(table)
+
+    kind = {"jumpship": "jumpship", "dropship": "dropship"}.get(args.command, "db")
+    if args.output:
+        with open(args.output, "wb", buffering=OUTPUT_BUFFER_BYTES) as out:
+            timed_sample(kind, args.n, write_rolls, out, table, records, args.n, args.format, args.seed)
+    else:
+        try:
+            timed_sample(kind, args.n, write_rolls,
+                         sys.stdout.buffer, table, records, args.n, args.format, args.seed)
+            sys.stdout.buffer.flush()
+        except BrokenPipeError:
+            # The reader (e.g. `| head`) has gone. Point stdout at devnull so
+            # the interpreter's final flush doesn't fail again, and exit the
+            # way a process killed by SIGPIPE would.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 141
+
+    if args.stats:
+        print("\n".join(format_roller_stats()), file=sys.stderr)
+    return 0
+
+
 # ============================================================
 # Menu
 # ============================================================
 
+def show_roller_stats():
+    if not roller_stats_enabled():
+        print(format_roller_stats()[0])
+        if _prompt_yes_no("Start collecting now? (y/n) ", default=False) is True:
+            enable_roller_stats()
+            print("Stats are on for the rest of this session.")
+        return
+    print("\n".join(format_roller_stats()))
+
+
 def main_menu():
     while True:
+        reload = poll_overrides()
+        if reload is not None:
+            print(format_override_reload(reload))
         choice = input(
-            "Roll what? (1=JumpShip, 2=DropShip, 3=Audit DS data, 4=Primitive JumpShip, q=quit): "
+            "Roll what? (1=JumpShip, 2=DropShip, 3=Audit DS data, 4=Primitive JumpShip, "
+            "5=Roller stats, q=quit): "
         ).strip().lower()
 
         if choice in ("q", "quit", "exit"):
@@ -509,14 +2231,19 @@ def main_menu():
             interactive_dropship_roller()
             continue
         if choice == "3":
-            audit_dropship_db()
+            audit_dropship_db(provenance=True)
             continue
         if choice == "4":
             interactive_primitive_jumpship_roller()
             continue
+        if choice == "5":
+            show_roller_stats()
+            continue
 
-        print("Please enter 1, 2, 3, 4, or q.")
+        print("Please enter 1, 2, 3, 4, 5, or q.")
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main_menu()
@@ -1,16 +1,245 @@
+import hashlib
 import json
+import os
 import re
+import sys
+import threading
 import time
 import html as ihtml
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.error import HTTPError
 from urllib.request import Request, urlopen
-from urllib.parse import urljoin
+from urllib.parse import quote, unquote, urlencode, urljoin, urlsplit
 
 
 BASE = "https://www.sarna.net"
-CATEGORY_URL = f"{BASE}/wiki/Category:DropShip_classes"
+CATEGORY_PATH = "/wiki/Category:DropShip_classes"
+CATEGORY_URL = f"{BASE}{CATEGORY_PATH}"
 
 USER_AGENT = "Mozilla/5.0 (compatible; BT-DropShip-Roller/1.1; +https://www.sarna.net)"
-REQUEST_DELAY_SEC = 0.35  # be polite
+
+# Be polite: on average at most REQUESTS_PER_SEC requests per host (short
+# bursts of RATE_BURST), however many of the MAX_WORKERS fetch threads are
+# waiting. That is no faster than the old one-page-then-sleep loop on a
+# fast connection, but slow responses now overlap instead of adding up.
+REQUESTS_PER_SEC = 4.0
+RATE_BURST = 4
+MAX_WORKERS = 4
+
+# "scrape" reads the category HTML and one page at a time; "api" uses the
+# wiki's api.php: category listing in pages of API_CATEGORY_LIMIT and the
+# wikitext of API_BATCH_SIZE pages per request (MediaWiki's limits for
+# anonymous clients are 500 and 50).
+BACKEND = "scrape"
+API_PATH = "/api.php"
+API_CATEGORY_LIMIT = 500
+API_BATCH_SIZE = 50
+
+# Page cache (see PageCache). TTL 0 = revalidate every page on every run,
+# which costs a 304 and no body for pages that did not change.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sarna_cache")
+CACHE_TTL_SEC = 0
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+# -----------------------------
+# Rate limiting
+# -----------------------------
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at `rate` tokens per second up to
+    `burst`. acquire() takes one token, sleeping until it is due. Waiters
+    reserve their token before sleeping, so they are spaced 1/rate apart
+    instead of all waking at once. rate <= 0 means unlimited.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token; returns the seconds slept for it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, shared by every fetch thread."""
+
+    def __init__(self, rate=REQUESTS_PER_SEC, burst=RATE_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.acquire()
+
+
+RATE_LIMITER = HostRateLimiter()
+
+
+# -----------------------------
+# Page cache
+# -----------------------------
+
+class NotCachedError(LookupError):
+    """An offline fetch() of a page the cache does not hold."""
+
+    def __init__(self, url):
+        super().__init__(f"not in the page cache (offline): {url}")
+        self.url = url
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages: <sha1 of URL>.body holds the text and
+    <sha1>.json the URL, ETag, Last-Modified and when it was last checked.
+
+    fetch() uses an entry without asking the server while it is younger
+    than `ttl` seconds (None = forever), and otherwise revalidates it with
+    If-None-Match / If-Modified-Since; a 304 keeps the cached body. Bodies
+    past `max_bytes` in total are evicted least recently used first.
+    offline=True never touches the network: cached pages only, and a page
+    that is not cached fails.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=CACHE_TTL_SEC, max_bytes=CACHE_MAX_BYTES,
+                 offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0, "missing": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._sizes = {}
+        for name in os.listdir(directory):
+            if name.endswith(".body"):
+                self._sizes[name[:-len(".body")]] = os.path.getsize(os.path.join(directory, name))
+        self._total = sum(self._sizes.values())
+        if self._total > self.max_bytes:
+            self._evict(keep=None)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return key, base + ".body", base + ".json"
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, url):
+        """(text, meta) for a cached URL, or None."""
+        _, body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return text, meta
+
+    def is_fresh(self, meta):
+        if self.ttl is None:
+            return True
+        return time.time() - meta.get("checked", 0) < self.ttl
+
+    @staticmethod
+    def validators(meta):
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def touch(self, url):
+        """Mark an entry as just used, for LRU eviction."""
+        try:
+            os.utime(self._paths(url)[1])
+        except OSError:
+            pass
+
+    def mark_checked(self, url, meta):
+        """Record a successful revalidation (304) of a cached entry."""
+        meta = dict(meta, checked=time.time())
+        self._write(self._paths(url)[2], json.dumps(meta).encode("utf-8"))
+        self.touch(url)
+
+    def put(self, url, text, etag=None, last_modified=None):
+        key, body_path, meta_path = self._paths(url)
+        body = text.encode("utf-8")
+        self._write(body_path, body)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified,
+                "checked": time.time(), "size": len(body)}
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self._total += len(body) - self._sizes.get(key, 0)
+            self._sizes[key] = len(body)
+            if self._total > self.max_bytes:
+                self._evict(keep=key)
+
+    def _write(self, path, data):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _evict(self, keep):
+        def last_used(key):
+            try:
+                return os.path.getmtime(os.path.join(self.directory, key + ".body"))
+            except OSError:
+                return 0.0
+
+        for key in sorted(self._sizes, key=last_used):
+            if self._total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for ext in (".body", ".json"):
+                try:
+                    os.remove(os.path.join(self.directory, key + ext))
+                except OSError:
+                    pass
+            self._total -= self._sizes.pop(key)
+            self.stats["evicted"] += 1
+
+    def summary(self):
+        s = self.stats
+        line = (f"Page cache: {s['fresh']} fresh, {s['revalidated']} unchanged (304), "
+                f"{s['downloaded']} downloaded")
+        if s["missing"]:
+            line += f", {s['missing']} not cached"
+        if s["evicted"]:
+            line += f", {s['evicted']} evicted"
+        return line + "."
+
+
+PAGE_CACHE = None  # set by main(); None = no caching
 
 
 # -----------------------------
@@ -18,10 +247,38 @@ REQUEST_DELAY_SEC = 0.35  # be polite
 # -----------------------------
 
 def fetch(url: str, timeout: int = 30) -> str:
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
-    return data.decode("utf-8", errors="replace")
+    cache = PAGE_CACHE
+    cached = cache.get(url) if cache is not None else None
+    headers = {"User-Agent": USER_AGENT}
+    if cache is not None:
+        if cached is not None and (cache.offline or cache.is_fresh(cached[1])):
+            cache.count("fresh")
+            cache.touch(url)
+            return cached[0]
+        if cache.offline:
+            cache.count("missing")
+            raise NotCachedError(url)
+        if cached is not None:
+            headers.update(cache.validators(cached[1]))
+
+    RATE_LIMITER.wait(url)
+    req = Request(url, headers=headers)
+    try:
+        with urlopen(req, timeout=timeout) as resp:
+            data = resp.read()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except HTTPError as e:
+        if e.code == 304 and cached is not None:
+            cache.count("revalidated")
+            cache.mark_checked(url, cached[1])
+            return cached[0]
+        raise
+    text = data.decode("utf-8", errors="replace")
+    if cache is not None:
+        cache.count("downloaded")
+        cache.put(url, text, etag, last_modified)
+    return text
 
 
 def fetch_raw_wikitext(page_url: str) -> str:
@@ -39,6 +296,76 @@ def strip_tags(html_text: str) -> str:
     return text
 
 
+# -----------------------------
+# Wikitext -> plain text
+# -----------------------------
+# Good enough for the rarity guesser and the fallback extractor, not a
+# MediaWiki renderer: templates, tables, refs and files/categories go away,
+# links keep their label, headings and list items keep their words. The
+# InfoBox template is kept as "key value" text, like its rendered table.
+
+_WT_COMMENT = re.compile(r"(?s)<!--.*?-->")
+_WT_REF = re.compile(r"(?is)<ref\b[^>]*/>|<ref\b[^>]*>.*?</ref\s*>")
+_WT_FILE_LINK = re.compile(r"(?i)\[\[\s*(?:File|Image|Media|Category)\s*:[^\[\]]*(?:\[\[[^\[\]]*\]\][^\[\]]*)*\]\]")
+_WT_LINK = re.compile(r"\[\[(?:[^|\[\]]*\|)?([^\[\]]*)\]\]")
+_WT_EXTERNAL = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+_WT_TEMPLATE = re.compile(r"\{\{((?:(?!\{\{|\}\}).)*)\}\}", re.S)
+_WT_TABLE = re.compile(r"\{\|(?:(?!\{\||\|\}).)*\|\}", re.S)
+_WT_HEADING = re.compile(r"(?m)^(=+)\s*(.*?)\s*\1\s*$")
+_WT_LIST_MARK = re.compile(r"(?m)^[*#:;]+\s*")
+_WT_MAGIC = re.compile(r"__[A-Z]+__")
+_WT_QUOTES = re.compile(r"'{2,}")
+_WT_TAG = re.compile(r"(?s)<[^>]+>")
+
+# Rendered prose shorter than this means a stub, redirect or error page.
+MIN_WIKITEXT_PROSE = 200
+
+
+def _render_template(m):
+    parts = m.group(1).split("|")
+    if not parts[0].strip().lower().startswith("infobox"):
+        return " "
+    fields = []
+    for part in parts[1:]:
+        key, eq, value = part.partition("=")
+        if eq and value.strip():
+            fields.append(f"{key.strip()} {value.strip()}")
+    return "\n" + "\n".join(fields) + "\n"
+
+
+def wikitext_to_text(wt: str) -> str:
+    """Plain text of a page's wikitext, whitespace collapsed like strip_tags()."""
+    text = _WT_COMMENT.sub(" ", wt)
+    text = _WT_REF.sub(" ", text)
+    text = _WT_FILE_LINK.sub(" ", text)
+    text = _WT_LINK.sub(r"\1", text)
+    text = _WT_EXTERNAL.sub(r"\1", text)
+
+    # Innermost first, so nested templates and tables come out whole.
+    n = 1
+    while n:
+        text, n = _WT_TEMPLATE.subn(_render_template, text)
+    n = 1
+    while n:
+        text, n = _WT_TABLE.subn(" ", text)
+
+    text = _WT_HEADING.sub(r"\2", text)
+    text = _WT_LIST_MARK.sub("", text)
+    text = _WT_MAGIC.sub(" ", text)
+    text = _WT_QUOTES.sub("", text)
+    text = _WT_TAG.sub(" ", text)
+    text = ihtml.unescape(text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def wikitext_prose(wt: str):
+    """wikitext_to_text(wt), or None if the wikitext is unusable for prose."""
+    if not wt or wt.lstrip()[:9].upper() == "#REDIRECT":
+        return None
+    text = wikitext_to_text(wt)
+    return text if len(text) >= MIN_WIKITEXT_PROSE else None
+
+
 def normalize_name(title: str) -> str:
     title = re.sub(r"\s*\(DropShip class\)\s*$", "", title, flags=re.I)
     title = re.sub(r"\s*\(DropShuttle class\)\s*$", "", title, flags=re.I)
@@ -76,12 +403,10 @@ def get_category_members(category_url: str):
         next_match = re.search(r'(?is)<a[^>]+href="([^"]+)"[^>]*>\s*next page\s*</a>', block)
         if next_match:
             next_href = ihtml.unescape(next_match.group(1))
-            url = urljoin(BASE, next_href)
+            url = urljoin(url, next_href)
         else:
             url = None
 
-        time.sleep(REQUEST_DELAY_SEC)
-
     dedup = []
     seen = set()
     for t, h in members:
@@ -91,6 +416,98 @@ def get_category_members(category_url: str):
     return dedup
 
 
+# -----------------------------
+# MediaWiki API backend
+# -----------------------------
+
+def api_url(category_url: str) -> str:
+    parts = urlsplit(category_url)
+    return f"{parts.scheme}://{parts.netloc}{API_PATH}"
+
+
+def page_href(title: str) -> str:
+    return "/wiki/" + quote(title.replace(" ", "_"), safe="/:()'!,")
+
+
+def api_query(url: str, params: dict):
+    """Yield each response of an action=query, following "continue"."""
+    params = dict(params, action="query", format="json", formatversion="2")
+    cont = {"continue": ""}
+    while True:
+        data = json.loads(fetch(url + "?" + urlencode({**params, **cont})))
+        if "error" in data:
+            err = data["error"]
+            raise RuntimeError(f"MediaWiki API error {err.get('code')}: {err.get('info')}")
+        yield data
+        if "continue" not in data:
+            return
+        cont = data["continue"]
+
+
+def api_category_members(category_url: str):
+    """get_category_members() through list=categorymembers."""
+    path = unquote(urlsplit(category_url).path)
+    category = path.rsplit("/wiki/", 1)[-1].replace("_", " ")
+    members = []
+    seen = set()
+    for data in api_query(api_url(category_url), {
+        "list": "categorymembers",
+        "cmtitle": category,
+        "cmtype": "page",
+        "cmlimit": API_CATEGORY_LIMIT,
+    }):
+        for m in data.get("query", {}).get("categorymembers", []):
+            title = m["title"]
+            if title not in seen:
+                seen.add(title)
+                members.append((title, page_href(title)))
+    return members
+
+
+def api_revisions(category_url: str, titles, content=True):
+    """
+    {title: {"revid", "timestamp", "wikitext"}} for up to API_BATCH_SIZE
+    titles in one prop=revisions request (plus any continuations);
+    content=False leaves the wikitext out, to check revisions cheaply.
+    Redirects are followed; missing pages are left out.
+    """
+    pages = {}
+    renamed = {}
+    for data in api_query(api_url(category_url), {
+        "prop": "revisions",
+        "rvprop": "ids|timestamp|content" if content else "ids|timestamp",
+        "rvslots": "main",
+        "redirects": "1",
+        "titles": "|".join(titles),
+    }):
+        query = data.get("query", {})
+        for r in query.get("normalized", []) + query.get("redirects", []):
+            renamed[r["from"]] = r["to"]
+        for page in query.get("pages", []):
+            revs = page.get("revisions")
+            if page.get("missing") or not revs:
+                continue
+            rev = revs[0]
+            found = {"revid": rev.get("revid"), "timestamp": rev.get("timestamp")}
+            if content:
+                wikitext = rev.get("slots", {}).get("main", {}).get("content", rev.get("content"))
+                if wikitext is None:
+                    continue
+                found["wikitext"] = wikitext
+            pages[page["title"]] = found
+
+    out = {}
+    for title in titles:
+        t = title
+        for _ in range(3):  # normalized, then redirected
+            if t in pages or t not in renamed:
+                break
+            t = renamed[t]
+        if t in pages:
+            out[title] = pages[t]
+    return out
+
+
 # -----------------------------
 # Infobox extraction (wikitext)
 # -----------------------------
@@ -239,81 +656,387 @@ def guess_rarity(article_text: str):
 
 
 # -----------------------------
-# Main build
+# Build manifest
 # -----------------------------
 
-def build_overrides():
-    print("Scraping DropShip class list from Sarna category...")
-    members = get_category_members(CATEGORY_URL)
-    print(f"Found {len(members)} category members.")
+MANIFEST_NAME = "dropship_build_manifest.json"
+# Bump when parse_page()'s output changes, so the next build re-parses every page.
+MANIFEST_FORMAT = 1
+CHECKPOINT_INTERVAL_SEC = 2.0
 
-    overrides = {}
-    failures = []
 
-    for idx, (title, href) in enumerate(members, start=1):
-        url = urljoin(BASE, href)
+class BuildManifest:
+    """
+    What the builds so far saw of each page: its revision (the API's revid,
+    or a hash of the wikitext when scraping), timestamp and parsed entry.
+    It is saved as a checkpoint while a build runs and again at the end.
+
+    A build that stopped part way leaves complete=False, and the next one
+    resumes it: pages that run already finished are taken as they are.
+    Otherwise every page's revision is checked, and only pages whose
+    revision changed are re-parsed. Pages that left the category are
+    dropped. A manifest for another wiki or MANIFEST_FORMAT is ignored, and
+    fresh=True ignores it regardless (it is overwritten as the build runs).
+    """
+
+    def __init__(self, path, category_url, fresh=False):
+        self.path = path
+        self.category_url = category_url
+        self.pages = {}
+        self.run = None
+        self._saved = time.monotonic()
+        data = None
         try:
-            # 1) Prefer infobox fields from raw wikitext
-            wt = fetch_raw_wikitext(url)
-            year, tech = extract_infobox_fields_from_wikitext(wt)
+            if not fresh:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable build manifest {path}: {e}")
+        if (isinstance(data, dict) and data.get("format") == MANIFEST_FORMAT
+                and data.get("category_url") == category_url
+                and isinstance(data.get("pages"), dict)):
+            self.pages = data["pages"]
+            if not data.get("complete", True):
+                self.run = data.get("run")
+        self.resuming = self.run is not None
+        if self.run is None:
+            self.run = time.time()
+
+    def finished(self, title):
+        """The record of a page the interrupted run being resumed got to, or None."""
+        record = self.pages.get(title)
+        if self.resuming and record is not None and record.get("run") == self.run:
+            return record
+        return None
+
+    def revisions(self):
+        """{title: revision} for every page with a known revision."""
+        return {t: r["revision"] for t, r in self.pages.items() if r.get("revision") is not None}
+
+    def record(self, title, rev, name=None, entry=None):
+        """Note a page as done this run; without name/entry, the old entry still holds."""
+        record = self.pages.get(title, {}) if name is None else {"name": name, "entry": entry}
+        record.update(rev, run=self.run)
+        self.pages[title] = record
+        return record
+
+    def prune(self, titles):
+        """Drop pages not in `titles`; returns how many went."""
+        gone = [t for t in self.pages if t not in titles]
+        for t in gone:
+            del self.pages[t]
+        return len(gone)
+
+    def save(self, complete=False):
+        data = {
+            "format": MANIFEST_FORMAT,
+            "category_url": self.category_url,
+            "run": self.run,
+            "complete": complete,
+            "pages": self.pages,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._saved = time.monotonic()
+
+    def checkpoint(self):
+        if time.monotonic() - self._saved >= CHECKPOINT_INTERVAL_SEC:
+            self.save()
+
+
+# -----------------------------
+# Main build
+# -----------------------------
+
+def page_wikitext(url: str) -> str:
+    """A page's raw wikitext, or "" if it can't be had."""
+    try:
+        return fetch_raw_wikitext(url)
+    except (OSError, LookupError):
+        return ""
+
 
-            # 2) Use HTML text for rarity guessing (prose)
-            html_page = fetch(url)
-            text = strip_tags(html_page)
+def wikitext_revision(wt: str):
+    """Stand-in revision for scraped pages: a hash of the wikitext (None if empty)."""
+    return "sha1:" + hashlib.sha1(wt.encode("utf-8")).hexdigest() if wt else None
 
-            # 3) Fallback for year/tech if raw parse misses
-            if year is None or tech is None:
-                y2, t2 = extract_infobox_fields_from_text(text)
-                year = year if year is not None else y2
-                tech = tech if tech is not None else t2
 
-            rarity, evidence = guess_rarity(text)
+def scrape_page(title: str, url: str):
+    """(name, override entry) for one category member's page."""
+    return parse_page(title, url, page_wikitext(url))
 
-            name = normalize_name(title)
 
-            overrides[name] = {
-                "year": year,           # int or None
-                "tech": tech,           # "IS"/"Clan"/None
-                "rarity": rarity,       # "common"/"uncommon"/"rare"/"very_rare"/"unknown"
-                "evidence": evidence,   # regex hit evidence
-                "source_title": title,
-                "source_url": url,
-            }
+def parse_page(title: str, url: str, wt: str):
+    """
+    (name, override entry) from a page's wikitext. The rendered HTML page
+    is fetched only if the wikitext is missing or unusable (redirect,
+    stub, error page).
+    """
+    # 1) Prefer infobox fields from raw wikitext
+    year, tech = extract_infobox_fields_from_wikitext(wt)
+
+    # 2) Prose for rarity guessing, rendered from the same wikitext
+    text = wikitext_prose(wt)
+    if text is None:
+        text = strip_tags(fetch(url))
 
-            if idx % 10 == 0:
-                print(f"  ...{idx}/{len(members)} done")
+    # 3) Fallback for year/tech if raw parse misses
+    if year is None or tech is None:
+        y2, t2 = extract_infobox_fields_from_text(text)
+        year = year if year is not None else y2
+        tech = tech if tech is not None else t2
 
+    rarity, evidence = guess_rarity(text)
+
+    return normalize_name(title), {
+        "year": year,           # int or None
+        "tech": tech,           # "IS"/"Clan"/None
+        "rarity": rarity,       # "common"/"uncommon"/"rare"/"very_rare"/"unknown"
+        "evidence": evidence,   # regex hit evidence
+        "source_title": title,
+        "source_url": url,
+    }
+
+
+def _scrape_batch(category_url, members, batch, backend, known):
+    """
+    [(member index, outcome)] for one batch, where outcome is the exception
+    the page raised or (rev, parsed): rev holds the page's "revision",
+    "revid" and "timestamp", and parsed is (name, entry), or None when the
+    revision matches `known` ({title: revision}) and the page was skipped.
+    """
+    titles = [members[i][0] for i in batch]
+    pages = None
+    if backend == "api":
+        pages = {}
+        if any(t in known for t in titles):
+            pages = api_revisions(category_url, titles, content=False)
+        stale = [t for t in titles if t not in pages or known.get(t) != pages[t]["revid"]]
+        if stale:
+            pages.update(api_revisions(category_url, stale))
+
+    out = []
+    for i, title in zip(batch, titles):
+        url = urljoin(category_url, members[i][1])
+        try:
+            if pages is None:
+                wt = page_wikitext(url)
+                rev = {"revision": wikitext_revision(wt), "revid": None, "timestamp": None}
+            else:
+                page = pages.get(title, {})
+                wt = page.get("wikitext")
+                rev = {"revision": page.get("revid"), "revid": page.get("revid"),
+                       "timestamp": page.get("timestamp")}
+            if rev["revision"] is not None and known.get(title) == rev["revision"]:
+                out.append((i, (rev, None)))
+            else:
+                out.append((i, (rev, parse_page(title, url, wt or ""))))
         except Exception as e:
-            failures.append((title, url, str(e)))
+            out.append((i, e))
+    return out
+
 
-        time.sleep(REQUEST_DELAY_SEC)
+def build_overrides(category_url=None, workers=MAX_WORKERS, backend=BACKEND, manifest=None):
+    """
+    Scrape every member of the category (default CATEGORY_URL) with up to
+    `workers` requests in flight; RATE_LIMITER keeps the request rate
+    polite. backend="api" lists the category and reads the pages through
+    api.php, API_BATCH_SIZE pages per request, instead of page by page.
+
+    With a BuildManifest, pages it already has are resumed or, when their
+    revision is unchanged, reused instead of re-parsed, and the manifest
+    is checkpointed as pages finish.
+    Returns (overrides, failures), both in category order.
+    """
+    category_url = category_url or CATEGORY_URL
+    print(f"Scraping DropShip class list from {category_url} ({backend}) ...")
+    if backend == "api":
+        members = api_category_members(category_url)
+    else:
+        members = get_category_members(category_url)
+    print(f"Found {len(members)} category members.")
 
+    results = [None] * len(members)
+    todo = list(range(len(members)))
+    known = {}
+    if manifest is not None:
+        dropped = manifest.prune({title for title, _ in members})
+        resumed = 0
+        for i, (title, _) in enumerate(members):
+            record = manifest.finished(title)
+            if record is not None and "entry" in record:
+                results[i] = (record["name"], record["entry"])
+                resumed += 1
+        todo = [i for i in todo if results[i] is None]
+        known = manifest.revisions()
+        if manifest.resuming:
+            print(f"Resuming an unfinished build: {resumed} pages already done.")
+        if dropped:
+            print(f"Dropped {dropped} pages no longer in the category.")
+
+    size = API_BATCH_SIZE if backend == "api" else 1
+    batches = [todo[k:k + size] for k in range(0, len(todo), size)]
+
+    errors = {}
+    done = reused = 0
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {
+            pool.submit(_scrape_batch, category_url, members, batch, backend, known): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = [(i, e) for i in batch]
+            for i, result in outcome:
+                if isinstance(result, Exception):
+                    errors[i] = str(result)
+                    continue
+                rev, parsed = result
+                if parsed is None:
+                    record = manifest.record(members[i][0], rev)
+                    results[i] = (record["name"], record["entry"])
+                    reused += 1
+                else:
+                    results[i] = parsed
+                    if manifest is not None:
+                        manifest.record(members[i][0], rev, *parsed)
+            if manifest is not None:
+                manifest.checkpoint()
+            previous, done = done, done + len(batch)
+            if done // 10 > previous // 10:
+                print(f"  ...{done}/{len(todo)} done")
+    finally:
+        # On Ctrl-C, don't wait for the queued pages, but keep what's done.
+        pool.shutdown(wait=False, cancel_futures=True)
+        if manifest is not None:
+            manifest.save()
+
+    if reused:
+        print(f"{reused} pages unchanged since the last build.")
+    overrides = dict(r for r in results if r is not None)
+    failures = [
+        (title, urljoin(category_url, href), errors[i])
+        for i, (title, href) in enumerate(members) if i in errors
+    ]
     return overrides, failures
 
 
-def write_outputs(overrides, failures):
-    with open("dropship_overrides.json", "w", encoding="utf-8") as f:
+# Fields the roller needs. Everything else (evidence, source_title,
+# source_url) only goes to the JSON file, which the roller reads lazily.
+HOT_FIELDS = ("year", "tech", "rarity")
+
+
+def hot_overrides(overrides):
+    return {
+        name: {k: data.get(k) for k in HOT_FIELDS}
+        for name, data in overrides.items()
+    }
+
+
+def write_outputs(overrides, failures, out_dir="."):
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, "dropship_overrides.json")
+    py_path = os.path.join(out_dir, "dropship_overrides.py")
+    failures_path = os.path.join(out_dir, "dropship_failures.txt")
+
+    with open(json_path, "w", encoding="utf-8") as f:
         json.dump(overrides, f, indent=2, ensure_ascii=False)
 
-    with open("dropship_overrides.py", "w", encoding="utf-8") as f:
+    with open(py_path, "w", encoding="utf-8") as f:
         f.write("# Auto-generated from Sarna DropShip class pages.\n")
-        f.write("# year/tech from infobox when present; rarity is heuristic from prose.\n\n")
+        f.write("# year/tech from infobox when present; rarity is heuristic from prose.\n")
+        f.write("# Evidence and source links are in dropship_overrides.json.\n\n")
         f.write("DROPSHIP_OVERRIDES = ")
-        f.write(repr(overrides))
+        f.write(repr(hot_overrides(overrides)))
         f.write("\n")
 
     if failures:
-        with open("dropship_failures.txt", "w", encoding="utf-8") as f:
+        with open(failures_path, "w", encoding="utf-8") as f:
             for title, url, err in failures:
                 f.write(f"{title}\t{url}\t{err}\n")
 
     print("\nWrote:")
-    print("  - dropship_overrides.json")
-    print("  - dropship_overrides.py")
+    print(f"  - {json_path}")
+    print(f"  - {py_path}")
     if failures:
-        print(f"  - dropship_failures.txt ({len(failures)} failures)")
+        print(f"  - {failures_path} ({len(failures)} failures)")
+
+
+def main(argv=None):
+    global RATE_LIMITER, PAGE_CACHE
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build dropship_overrides.py/.json from Sarna.")
+    parser.add_argument("--base-url", default=BASE,
+                        help="wiki to read (default %(default)s), e.g. a local stand-in server")
+    parser.add_argument("--backend", choices=("scrape", "api"), default=BACKEND,
+                        help="page-by-page scraper or the wiki's api.php (default %(default)s)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help="requests in flight at once (default %(default)s)")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SEC,
+                        help="requests per second per host (default %(default)s, 0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=RATE_BURST,
+                        help="requests allowed back to back before --rate applies (default %(default)s)")
+    parser.add_argument("--out-dir", default=".", help="where to write the outputs (default: here)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="page cache directory (default %(default)s)")
+    parser.add_argument("--no-cache", action="store_true", help="fetch everything, cache nothing")
+    parser.add_argument("--cache-ttl", type=float, default=CACHE_TTL_SEC,
+                        help="seconds a cached page is used without revalidating (default %(default)s)")
+    parser.add_argument("--cache-max-mb", type=float, default=CACHE_MAX_BYTES / 2**20,
+                        help="evict least recently used pages past this size (default %(default)s)")
+    parser.add_argument("--offline", action="store_true",
+                        help="build from the page cache alone, no network")
+    parser.add_argument("--manifest",
+                        help=f"build manifest for resuming and incremental builds "
+                             f"(default: {MANIFEST_NAME} in --out-dir)")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help="no resuming: fetch and parse every page")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the manifest's earlier results (it is still written)")
+    args = parser.parse_args(argv)
+    if args.offline and args.no_cache:
+        parser.error("--offline needs the page cache")
+
+    RATE_LIMITER = HostRateLimiter(args.rate, args.burst)
+    if not args.no_cache:
+        PAGE_CACHE = PageCache(args.cache_dir, ttl=args.cache_ttl,
+                               max_bytes=int(args.cache_max_mb * 2**20), offline=args.offline)
+    category_url = args.base_url.rstrip("/") + CATEGORY_PATH
+    manifest = None
+    if not args.no_manifest:
+        manifest = BuildManifest(args.manifest or os.path.join(args.out_dir, MANIFEST_NAME),
+                                 category_url, fresh=args.full)
+    start = time.perf_counter()
+    try:
+        overrides, failures = build_overrides(category_url, args.workers, args.backend, manifest)
+    except KeyboardInterrupt:
+        if manifest is None:
+            raise
+        print(f"\nInterrupted. Progress is saved in {manifest.path}; run again to resume.")
+        return 130
+    except NotCachedError as e:
+        # Page misses are per-page failures; only the category listing gets here.
+        print(f"The category listing ({e.url}) is not in the page cache; "
+              f"--offline needs a previous online run to have cached it.", file=sys.stderr)
+        return 1
+    write_outputs(overrides, failures, args.out_dir)
+    if manifest is not None:
+        manifest.save(complete=True)
+    if PAGE_CACHE is not None:
+        print(PAGE_CACHE.summary())
+    print(f"Finished in {time.perf_counter() - start:.1f}s.")
+    return 0
 
 
 if __name__ == "__main__":
-    overrides, failures = build_overrides()
-    write_outputs(overrides, failures)
+    sys.exit(main())
@@ -7,9 +7,12 @@ Auto-generated from the user's uploaded PDF:
 Notes:
 - 'year' is the earliest intro/model year found on a record sheet Type line (if present).
 - 'rarity' is a rough guess based on how many distinct variants are present in the PDF.
-- For anything you disagree with, add/override entries in primitive_jumpship_overrides.py.
+- For anything you disagree with, add/override entries in primitive_jumpship_overrides.json.
 """
 
+import json
+import os
+
 PRIMITIVE_JUMPSHIP_DB = [
   {
     "name": "Pathfinder",
@@ -330,23 +333,42 @@ PRIMITIVE_JUMPSHIP_DB = [
   }
 ]
 
-# Default weighting you can tweak.
-PRIMITIVE_RARITY_WEIGHTS = {
-  "common": 1.0,
-  "uncommon": 0.6,
-  "rare": 0.01,
-  "unknown": 0.07,
-}
+# Rarity weights live in rarity_weights.json ("primitive"), and per-class
+# fixes in primitive_jumpship_overrides.json; bt_ship_rollers.py applies both
+# when it loads this DB, so the rows above stay as extracted.
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _read_json(name, default):
+    try:
+        with open(os.path.join(_HERE, name), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return default
+    return data if isinstance(data, dict) else default
 
-try:
-    from primitive_jumpship_overrides import PRIMITIVE_JS_OVERRIDES
-except Exception:
-    PRIMITIVE_JS_OVERRIDES = {}
 
-def apply_primitive_overrides(db):
-    """Apply PRIMITIVE_JS_OVERRIDES by class name."""
+# Kept for code that imported the weights from this module: the "primitive"
+# table of rarity_weights.json as it stood at import (bt_ship_rollers.py
+# reloads the file itself when it changes).
+PRIMITIVE_RARITY_WEIGHTS = _read_json("rarity_weights.json", {}).get("primitive", {
+    "common": 1.0,
+    "uncommon": 0.6,
+    "rare": 0.01,
+    "unknown": 0.07,
+})
+
+
+def apply_primitive_overrides(db, overrides=None):
+    """
+    Apply `overrides` ({class name: fields}; default: the contents of
+    primitive_jumpship_overrides.json) to the rows of db, by class name.
+    """
+    if overrides is None:
+        overrides = _read_json("primitive_jumpship_overrides.json", {})
     by_name = {d["name"]: d for d in db}
-    for name, data in PRIMITIVE_JS_OVERRIDES.items():
+    for name, data in overrides.items():
         if name not in by_name:
             continue
         if data.get("year") is not None:
@@ -355,6 +377,7 @@ def apply_primitive_overrides(db):
             by_name[name]["tech"] = data["tech"]
         if data.get("rarity"):
             by_name[name]["rarity"] = data["rarity"]
+        for field in ("ramp_years", "decline_year", "extinct_year"):
+            if data.get(field) is not None:
+                by_name[name][field] = data[field]
     return db
-
-PRIMITIVE_JUMPSHIP_DB = apply_primitive_overrides(PRIMITIVE_JUMPSHIP_DB)
@@ -0,0 +1,188 @@
+"""
+Load generator for roll_server.py (standard library asyncio only).
+
+    python roll_server.py &
+    python roll_loadgen.py -c 32 -d 10 "/dropship?year=3025&n=1"
+    python roll_loadgen.py --batch 16 "/primitive?max_year=2300"
+
+Opens -c keep-alive connections, each sending one request at a time for -d
+seconds (or until -r requests in total), then prints requests/sec and
+latency percentiles. --batch K turns the target into a POST /batch with K
+copies of its query as entries.
+"""
+import asyncio
+import json
+import sys
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_TARGET = "/dropship?n=1"
+
+
+def build_request(host, port, target, batch=0):
+    """Raw HTTP/1.1 request bytes for `target` (or a /batch POST of it)."""
+    if not batch:
+        return (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+
+    url = urlsplit(target)
+    entry = {"kind": url.path.strip("/")}
+    entry.update(parse_qsl(url.query))
+    body = json.dumps([entry] * batch).encode("utf-8")
+    return (
+        "POST /batch HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    ).encode("latin-1") + body
+
+
+async def _read_response(reader):
+    """(status, keep_alive) after consuming one response."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    status = int(status_line.split()[1])
+
+    length = 0
+    keep_alive = True
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "connection":
+            keep_alive = value.strip().lower() != "close"
+    if length:
+        await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def _client(host, port, request, deadline, budget, stats):
+    reader = writer = None
+    try:
+        while time.perf_counter() < deadline:
+            if budget is not None:
+                if budget[0] <= 0:
+                    break
+                budget[0] -= 1
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+
+            start = time.perf_counter()
+            try:
+                writer.write(request)
+                status, keep_alive = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                stats["errors"] += 1
+                writer.close()
+                writer = None
+                continue
+            stats["latencies"].append(time.perf_counter() - start)
+            if status != 200:
+                stats["errors"] += 1
+            if not keep_alive:
+                writer.close()
+                writer = None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def run_load(host, port, target, connections=16, duration=10.0, requests=None, batch=0):
+    """
+    Drive the server and return a results dict: requests, errors, seconds,
+    requests_per_sec and latency_ms (p50/p90/p99/max).
+    """
+    request = build_request(host, port, target, batch)
+    stats = {"latencies": [], "errors": 0}
+    budget = [requests] if requests is not None else None
+    deadline = time.perf_counter() + (duration if requests is None else float("inf"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, request, deadline, budget, stats)
+        for _ in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(stats["latencies"])
+    done = len(latencies)
+    return {
+        "target": target,
+        "batch": batch,
+        "connections": connections,
+        "requests": done,
+        "errors": stats["errors"],
+        "seconds": elapsed,
+        "requests_per_sec": done / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p90": percentile(latencies, 90) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": (latencies[-1] * 1000) if latencies else 0.0,
+        },
+    }
+
+
+def format_results(r):
+    lat = r["latency_ms"]
+    lines = [
+        f"Target:       {r['target']}" + (f" (batch of {r['batch']})" if r["batch"] else ""),
+        f"Connections:  {r['connections']}",
+        f"Requests:     {r['requests']} in {r['seconds']:.2f}s ({r['errors']} errors)",
+        f"Requests/sec: {r['requests_per_sec']:.0f}",
+        f"Latency ms:   p50 {lat['p50']:.3f}  p90 {lat['p90']:.3f}  "
+        f"p99 {lat['p99']:.3f}  max {lat['max']:.3f}",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load generator for roll_server.py.")
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET,
+                        help=f"path and query to request (default {DEFAULT_TARGET})")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-c", "--connections", type=int, default=16)
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="seconds (default 10)")
+    parser.add_argument("-r", "--requests", type=int, help="stop after this many requests instead")
+    parser.add_argument("--batch", type=int, default=0, help="send POST /batch with this many entries")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        results = asyncio.run(run_load(
+            args.host, args.port, args.target,
+            connections=args.connections,
+            duration=args.duration,
+            requests=args.requests,
+            batch=args.batch,
+        ))
+    except OSError as e:
+        print(f"Could not reach http://{args.host}:{args.port}/: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
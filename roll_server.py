@@ -0,0 +1,468 @@
+"""
+Local HTTP roll service (standard library asyncio only).
+
+    python roll_server.py --port 8765
+
+Roll endpoints (GET, filters in the query string, JSON out):
+  /jumpship?n=5
+  /dropship?n=5&tech_choice=IS&year=3025&strict_year=1&rarity_mode=common_uncommon
+           &include_unknown_rarity=0&include_unknown_tech=0
+  /primitive?n=5&max_year=2300&include_unknown_years=0&allowed_rarities=common,uncommon
+Filter names and meanings are those of roll_dropship() / roll_from_db().
+Every roll endpoint also takes seed=N (same rolls as the batch CLI's
+--seed N) and labels=1 (label strings instead of records).
+
+POST /batch takes a JSON list of {"kind": "jumpship"|"dropship"|"primitive",
+"n": ..., <filters>} and answers {"results": [...]} in the same order, so a
+client can ask for several filter sets in one round trip.
+
+GET /audit returns the data-coverage summary (provenance=1 adds the
+evidence counts) and GET /stats get_roller_stats() (start the server with
+--stats or BT_ROLLER_STATS=1 for the full counters and timings).
+
+Connections are HTTP/1.1 keep-alive (pipelining works). Filtered tables come
+from the roller's LRU cache and each one's rows are JSON-encoded once, so a
+response is a join of pre-built bytes. The default tables are compiled
+before the server starts accepting connections.
+
+Edits to local_overrides.json, primitive_jumpship_overrides.json and
+rarity_weights.json are picked up while running (bt.poll_overrides() every
+--reload-interval seconds, on the event loop); requests already being
+answered finish on the tables they started with.
+"""
+import asyncio
+import json
+import random
+import sys
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+import bt_ship_rollers as bt
+from roll_tables import iter_index_chunks
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+MAX_ROLLS_PER_REQUEST = 100_000
+MAX_BATCH_ENTRIES = 256
+MAX_BODY_BYTES = 1 << 20
+KEEPALIVE_TIMEOUT_SEC = 30.0
+
+# Unseeded requests up to this size draw one alias roll at a time from the
+# server's own RNG; larger or seeded ones go through iter_index_chunks().
+SMALL_ROLL_COUNT = 256
+
+ENCODED_ROWS_CACHE_SIZE = 64
+
+_RNG = random.Random()
+_ENCODED_ROWS = OrderedDict()
+
+
+class RequestError(Exception):
+    """Bad request parameters; carries the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================
+# Filters
+# ============================================================
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    v = str(value).strip().lower()
+    if v in ("1", "true", "yes", "y", "on"):
+        return True
+    if v in ("0", "false", "no", "n", "off"):
+        return False
+    raise ValueError(f"expected true/false, got {value!r}")
+
+
+def _parse_optional_int(value):
+    if value is None or str(value).strip().lower() in ("", "none"):
+        return None
+    return int(value)
+
+
+def _parse_set(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return {str(v).strip() for v in value if str(v).strip()} or None
+
+
+def _choice(*options):
+    def parse(value):
+        if value not in options:
+            raise ValueError(f"expected one of {', '.join(options)}")
+        return value
+    return parse
+
+
+DROPSHIP_FILTERS = {
+    "tech_choice": _choice("IS", "Clan", "Any"),
+    "year": _parse_optional_int,
+    "strict_year": _parse_bool,
+    "rarity_mode": _choice("any", "common", "common_uncommon"),
+    "include_unknown_rarity": _parse_bool,
+    "include_unknown_tech": _parse_bool,
+}
+
+PRIMITIVE_FILTERS = {
+    "max_year": _parse_optional_int,
+    "include_unknown_years": _parse_bool,
+    "allowed_tech": _parse_set,
+    "allowed_rarities": _parse_set,
+}
+
+ROLL_KINDS = {
+    "jumpship": {},
+    "dropship": DROPSHIP_FILTERS,
+    "primitive": PRIMITIVE_FILTERS,
+}
+
+# Roller stats counter for each endpoint.
+STATS_KINDS = {"jumpship": "jumpship", "dropship": "dropship", "primitive": "db"}
+
+_ROLL_OPTIONS = ("n", "seed", "labels")
+
+
+def _parse_roll_params(kind, params):
+    """(n, seed, labels, filters) from a query-string or batch-entry dict."""
+    allowed = ROLL_KINDS[kind]
+    try:
+        n = int(params.get("n", 1))
+        seed = _parse_optional_int(params.get("seed"))
+        labels = _parse_bool(params.get("labels", False))
+    except (TypeError, ValueError) as e:
+        raise RequestError(f"bad n/seed/labels: {e}") from None
+    if not 0 <= n <= MAX_ROLLS_PER_REQUEST:
+        raise RequestError(f"n must be between 0 and {MAX_ROLLS_PER_REQUEST}")
+
+    filters = {}
+    for name, value in params.items():
+        if name in _ROLL_OPTIONS or name == "kind":
+            continue
+        parse = allowed.get(name)
+        if parse is None:
+            raise RequestError(f"unknown {kind} filter: {name!r}")
+        try:
+            filters[name] = parse(value)
+        except (TypeError, ValueError) as e:
+            raise RequestError(f"bad value for {name}: {e}") from None
+    return n, seed, labels, filters
+
+
+# ============================================================
+# Tables and encoded rows
+# ============================================================
+
+def _table_for(kind, filters):
+    """(table, records builder) for one filter set; tables come from the roller's LRU."""
+    if kind == "jumpship":
+        return bt.JUMPSHIP_TABLE, bt._jumpship_records
+
+    if kind == "dropship":
+        if not bt.DROPSHIP_DB:
+            raise RequestError("No DropShip data loaded. Run build_dropship_overrides.py first.", 503)
+        table = bt.get_dropship_table(**filters)
+        if table is None:
+            raise RequestError("No candidates (filters too strict).", 422)
+        return table, bt._dropship_records
+
+    if not bt.PRIMITIVE_JUMPSHIP_DB:
+        raise RequestError("No Primitive JumpShip data loaded.", 503)
+    table = bt.get_db_table(
+        bt.PRIMITIVE_JUMPSHIP_DB,
+        rarity_weights=bt.PRIMITIVE_RARITY_WEIGHTS,
+        **filters,
+    )
+    if table is None:
+        raise RequestError("No matching classes found with the current filters.", 422)
+    return table, bt._primitive_records
+
+
+def _encoded_rows(table, make_records, labels):
+    """One JSON fragment (bytes) per table row, built once per table."""
+    key = (id(table), labels)
+    cached = _ENCODED_ROWS.get(key)
+    if cached is not None and cached[0] is table:
+        _ENCODED_ROWS.move_to_end(key)
+        return cached[1]
+
+    records = make_records(table)
+    if labels:
+        rows = [json.dumps(r["label"], ensure_ascii=False).encode("utf-8") for r in records]
+    else:
+        rows = [json.dumps(r, ensure_ascii=False).encode("utf-8") for r in records]
+
+    # Holding the table keeps id(table) from being reused while cached.
+    _ENCODED_ROWS[key] = (table, rows)
+    while len(_ENCODED_ROWS) > ENCODED_ROWS_CACHE_SIZE:
+        _ENCODED_ROWS.popitem(last=False)
+    return rows
+
+
+def _roll_indices(table, n, seed):
+    if seed is None and n <= SMALL_ROLL_COUNT:
+        roll_index = table.roll_index
+        return [roll_index(_RNG) for _ in range(n)]
+    indices = []
+    for chunk in iter_index_chunks(table, n, seed=seed):
+        indices.extend(chunk)
+    return indices
+
+
+def roll_json(kind, params):
+    """
+    Roll for one request and return the JSON body as bytes:
+    {"kind": ..., "n": ..., "rolls": [...]}. Raises RequestError.
+    """
+    if not isinstance(kind, str) or kind not in ROLL_KINDS:
+        raise RequestError(f"unknown roll kind: {kind!r}", 404)
+    if not isinstance(params, dict):
+        raise RequestError("roll parameters must be an object")
+    n, seed, labels, filters = _parse_roll_params(kind, params)
+    table, make_records = _table_for(kind, filters)
+    rows = _encoded_rows(table, make_records, labels)
+    indices = bt.timed_sample(STATS_KINDS[kind], n, _roll_indices, table, n, seed)
+    picked = b",".join([rows[i] for i in indices])
+    return b'{"kind":"%s","n":%d,"rolls":[%s]}' % (kind.encode("ascii"), n, picked)
+
+
+def _error_json(message):
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+def batch_json(entries):
+    """
+    Body for POST /batch. Each entry is rolled independently; a failing
+    entry becomes {"error": ...} in its slot instead of failing the batch.
+    """
+    if not isinstance(entries, list):
+        raise RequestError("batch body must be a JSON list")
+    if len(entries) > MAX_BATCH_ENTRIES:
+        raise RequestError(f"at most {MAX_BATCH_ENTRIES} entries per batch")
+
+    total = 0
+    for entry in entries:
+        try:
+            total += max(int(entry.get("n", 1)), 0)
+        except (AttributeError, TypeError, ValueError):
+            pass  # reported in that entry's slot below
+    if total > MAX_ROLLS_PER_REQUEST:
+        raise RequestError(f"at most {MAX_ROLLS_PER_REQUEST} rolls per batch")
+
+    parts = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            parts.append(_error_json("batch entries must be objects"))
+            continue
+        try:
+            parts.append(roll_json(entry.get("kind"), entry))
+        except RequestError as e:
+            parts.append(_error_json(str(e)))
+    return b'{"results":[' + b",".join(parts) + b"]}"
+
+
+def warm_tables():
+    """Load the ship data and compile/encode the default tables up front."""
+    for kind in ROLL_KINDS:
+        for labels in (False, True):
+            try:
+                table, make_records = _table_for(kind, {})
+            except RequestError:
+                continue
+            _encoded_rows(table, make_records, labels)
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def handle_request(method, target, body=b""):
+    """(status, JSON body bytes) for one request. No I/O; usable directly."""
+    url = urlsplit(target)
+    path = url.path.rstrip("/") or "/"
+    params = dict(parse_qsl(url.query, keep_blank_values=True))
+
+    try:
+        if path == "/batch":
+            if method != "POST":
+                return 405, _error_json("use POST for /batch")
+            try:
+                entries = json.loads(body or b"null")
+            except ValueError as e:
+                raise RequestError(f"batch body is not valid JSON: {e}") from None
+            return 200, batch_json(entries)
+
+        if method not in ("GET", "HEAD"):
+            return 405, _error_json(f"use GET for {path}")
+
+        kind = path.lstrip("/")
+        if kind in ROLL_KINDS:
+            return 200, roll_json(kind, params)
+        if path == "/audit":
+            provenance = _parse_bool(params.get("provenance", False))
+            return 200, json.dumps(bt.dropship_audit_summary(provenance)).encode("utf-8")
+        if path == "/stats":
+            return 200, json.dumps(bt.get_roller_stats()).encode("utf-8")
+        return 404, _error_json(f"no such endpoint: {path}")
+
+    except RequestError as e:
+        return e.status, _error_json(str(e))
+    except ValueError as e:
+        return 400, _error_json(str(e))
+
+
+def _response(status, body, keep_alive, head=False):
+    header = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode("latin-1")
+    return header if head else header + body
+
+
+async def _read_request(reader):
+    """(method, target, version, headers, body), or None at end of stream."""
+    line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT_SEC)
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise RequestError("malformed request line")
+    method, target, version = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise RequestError("bad Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise RequestError("request body too large", 413)
+    body = await reader.readexactly(length) if length else b""
+    return method, target, version, headers, body
+
+
+async def _serve_connection(reader, writer):
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except RequestError as e:
+                writer.write(_response(e.status, _error_json(str(e)), keep_alive=False))
+                await writer.drain()
+                return
+            if request is None:
+                return
+
+            method, target, version, headers, body = request
+            connection = headers.get("connection", "").lower()
+            if version == "HTTP/1.0":
+                keep_alive = connection == "keep-alive"
+            else:
+                keep_alive = connection != "close"
+
+            try:
+                status, payload = handle_request(method, target, body)
+            except Exception as e:  # keep serving other requests
+                status, payload = 500, _error_json(f"{type(e).__name__}: {e}")
+
+            writer.write(_response(status, payload, keep_alive, head=(method == "HEAD")))
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def _watch_overrides(interval):
+    while True:
+        await asyncio.sleep(interval)
+        summary = bt.poll_overrides()
+        if summary is not None:
+            print(bt.format_override_reload(summary), file=sys.stderr, flush=True)
+            if "error" not in summary:
+                warm_tables()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None,
+                reload_interval=bt.OVERRIDE_POLL_INTERVAL_SEC):
+    """
+    Run the roll service until cancelled. `ready`, if given, is called with
+    the listening server once the tables are warm. The tuning files are
+    polled every `reload_interval` seconds (0 or None = never).
+    """
+    warm_tables()
+    server = await asyncio.start_server(_serve_connection, host, port)
+    watcher = asyncio.create_task(_watch_overrides(reload_interval)) if reload_interval else None
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local HTTP service for the BattleTech ship rollers.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"bind address (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default {DEFAULT_PORT})")
+    parser.add_argument("--stats", action="store_true", help="collect roller stats for /stats")
+    parser.add_argument("--reload-interval", type=float, default=bt.OVERRIDE_POLL_INTERVAL_SEC,
+                        help="seconds between checks of the override/weight files "
+                             "(default %(default)s, 0 = off)")
+    args = parser.parse_args(argv)
+    if args.stats:
+        bt.enable_roller_stats()
+
+    def ready(server):
+        for sock in server.sockets:
+            host, port = sock.getsockname()[:2]
+            print(f"Roll service listening on http://{host}:{port}/", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, ready=ready, reload_interval=args.reload_interval))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,532 @@
+"""
+Compiled roll tables shared by the ship rollers.
+
+A RollTable is built once from a candidate list and its weights. After that
+every draw is O(1) using Walker's alias method (Vose's construction), so
+rolling n ships costs O(pool + n) instead of O(n * pool).
+
+Every roller draws from a RollTable; two things feed one:
+  - Table: a declarative weighted chart. Entries may be nested Tables (e.g.
+    the JumpShip "minor bucket" d6), which are flattened ahead of time so
+    the whole chart is a single draw.
+  - YearIndex: a ship DB grouped into (tech, rarity) buckets sorted by
+    intro year, so a chronology cutoff is a bisect instead of a scan.
+Table.compile() and YearIndex.candidates() both take a predicate filter.
+YearIndex.roll() also makes a single draw straight off the index, using
+per-bucket prefix weight sums: a bisect instead of compiling a table.
+
+multinomial_counts() answers "how many of each" without rolling one by one:
+its cost depends on the number of classes, not on n.
+
+NumPy is optional: batch_indices() uses it when installed and falls back to
+the pure-stdlib alias sampler otherwise.
+"""
+import random
+from bisect import bisect_right
+from heapq import heapify, heappop
+from itertools import accumulate
+from math import floor, lgamma, log, sqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAVE_NUMPY = np is not None
+
+
+def make_rng(seed=None):
+    """Independent random.Random; seed=None seeds from the OS."""
+    return random.Random(seed)
+
+
+def spawn_rng(seed, stream):
+    """
+    RNG for sub-stream `stream` of master `seed`. Streams are derived by
+    hashing, so they do not depend on which process or order they run in.
+    """
+    import hashlib
+
+    digest = hashlib.sha256(f"{seed}:{stream}".encode("ascii")).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def build_alias_table(weights):
+    """
+    Vose's alias method. Returns (prob, alias) lists such that drawing a
+    uniform column i and keeping i with probability prob[i] (else alias[i])
+    reproduces the normalized weights exactly.
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    if n == 0 or total <= 0:
+        raise ValueError("Total of weights must be greater than zero")
+
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] = (scaled[g] + scaled[s]) - 1.0
+        if scaled[g] < 1.0:
+            small.append(g)
+        else:
+            large.append(g)
+
+    # Anything left over is 1.0 up to float rounding.
+    for i in large + small:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+class RollTable:
+    """
+    Immutable weighted table over `items`, compiled once per filter set.
+    """
+
+    __slots__ = ("items", "weights", "cum_weights", "prob", "alias")
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.weights = [float(w) for w in weights]
+        if len(self.items) != len(self.weights):
+            raise ValueError("items and weights must be the same length")
+        self.cum_weights = list(accumulate(self.weights))
+        self.prob, self.alias = build_alias_table(self.weights)
+
+    def __len__(self):
+        return len(self.items)
+
+    def roll_index(self, rng=random):
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+    def roll(self, rng=random):
+        return self.items[self.roll_index(rng)]
+
+    def roll_cdf(self, rng=random):
+        """
+        One draw by inverse CDF, O(log n): the same uniform picks the same
+        row as YearIndex.roll() over the pool this table was compiled from.
+        """
+        cum = self.cum_weights
+        return self.items[bisect_right(cum, rng.random() * cum[-1], 0, len(cum) - 1)]
+
+    def iter_rolls(self, rng=random):
+        """Endless stream of draws; constant memory."""
+        items = self.items
+        prob = self.prob
+        alias = self.alias
+        k = len(prob)
+        rand = rng.random
+        while True:
+            u = rand() * k
+            i = int(u)
+            yield items[i] if (u - i) < prob[i] else items[alias[i]]
+
+    def sample_counts(self, n, rng=random):
+        """Per-item counts for n draws, parallel to self.items."""
+        return multinomial_counts(n, self.weights, rng)
+
+    def sample(self, n, rng=random):
+        """n independent draws (with replacement)."""
+        items = self.items
+        prob = self.prob
+        alias = self.alias
+        k = len(prob)
+        rand = rng.random
+        out = []
+        append = out.append
+        for _ in range(n):
+            u = rand() * k
+            i = int(u)
+            append(items[i] if (u - i) < prob[i] else items[alias[i]])
+        return out
+
+    def sample_unique_indices(self, n, rng=random):
+        """
+        Up to n distinct indices, in the order a "roll, remove the pick,
+        roll again" loop would produce them. Each item gets an Exp(weight)
+        arrival time and the n earliest win (Efraimidis-Spirakis), so the
+        cost is O(pool + n log pool) however skewed the weights are.
+        Zero-weight items never come up; if fewer than n items have weight,
+        all of them are returned.
+        """
+        expovariate = rng.expovariate
+        keys = [(expovariate(w), i) for i, w in enumerate(self.weights) if w > 0]
+        if n >= len(keys):
+            keys.sort()
+            return [i for _, i in keys]
+        heapify(keys)
+        return [heappop(keys)[1] for _ in range(n)]
+
+    def sample_unique(self, n, rng=random):
+        """Up to n distinct items, weighted, without replacement."""
+        items = self.items
+        return [items[i] for i in self.sample_unique_indices(n, rng)]
+
+
+class Table:
+    """
+    Declarative weighted table. `entries` is a list of (weight, outcome);
+    an outcome is a plain value or a nested Table, which is rolled when its
+    entry comes up.
+    """
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    @classmethod
+    def from_die(cls, sides, faces):
+        """
+        Table for a die chart: `faces` is a list of (low, high, outcome)
+        covering 1..sides exactly once.
+        """
+        expected = 1
+        entries = []
+        for low, high, outcome in faces:
+            if low != expected or high < low:
+                raise ValueError(f"d{sides} chart has a gap or overlap at {low}")
+            entries.append((high - low + 1, outcome))
+            expected = high + 1
+        if expected != sides + 1:
+            raise ValueError(f"d{sides} chart stops at {expected - 1}")
+        return cls(entries)
+
+    def total(self):
+        return float(sum(w for w, _ in self.entries))
+
+    def flatten(self, predicate=None):
+        """
+        (outcomes, weights) with nested tables expanded in place. A nested
+        table shares its parent entry's weight in proportion to its own
+        weights; the predicate then drops outcomes from the flat list.
+        """
+        outcomes = []
+        weights = []
+        for weight, outcome in self.entries:
+            if isinstance(outcome, Table):
+                sub_total = outcome.total()
+                if sub_total <= 0:
+                    continue
+                sub_outcomes, sub_weights = outcome.flatten(predicate)
+                outcomes.extend(sub_outcomes)
+                weights.extend(weight * w / sub_total for w in sub_weights)
+            elif predicate is None or predicate(outcome):
+                outcomes.append(outcome)
+                weights.append(weight)
+        return outcomes, weights
+
+    def compile(self, predicate=None):
+        """RollTable over the flattened outcomes, or None if nothing is left."""
+        outcomes, weights = self.flatten(predicate)
+        if not outcomes or sum(weights) <= 0:
+            return None
+        return RollTable(outcomes, weights)
+
+
+def binomial_variate(n, p, rng=random):
+    """
+    Number of successes in n trials with success probability p.
+
+    Uses rng.binomialvariate when the RNG has it (Python 3.12+). Otherwise
+    geometric skipping for small n*p and Hormann's BTRS rejection sampler
+    for large n*p, so the expected cost does not grow with n.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+
+    native = getattr(rng, "binomialvariate", None)
+    if native is not None:
+        return native(n, p)
+
+    if p > 0.5:
+        return n - binomial_variate(n, 1.0 - p, rng)
+
+    if n * p < 10.0:
+        # Count how many geometric gaps between successes fit inside n.
+        c = log(1.0 - p)
+        if not c:
+            return 0
+        x = 0
+        y = 0
+        while True:
+            y += floor(log(1.0 - rng.random()) / c) + 1
+            if y > n:
+                return x
+            x += 1
+
+    # BTRS: Hormann, "The generation of binomial random variates" (1993).
+    spq = sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    vr = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = log(p / (1.0 - p))
+    m = floor((n + 1) * p)
+    h = lgamma(m + 1) + lgamma(n - m + 1)
+
+    while True:
+        u = rng.random() - 0.5
+        v = rng.random()
+        us = 0.5 - abs(u)
+        k = floor((2.0 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+        if us >= 0.07 and v <= vr:
+            return k
+        v = log(v * alpha / (a / (us * us) + b))
+        if v <= h - lgamma(k + 1) - lgamma(n - k + 1) + (k - m) * lpq:
+            return k
+
+
+def multinomial_counts(n, weights, rng=random):
+    """
+    Counts for n weighted draws, sampled as a chain of conditional
+    binomials: O(len(weights)) regardless of n.
+    """
+    counts = [0] * len(weights)
+    # Suffix sums keep the last positive weight at p == 1 exactly.
+    rest = list(accumulate(reversed(weights)))[::-1]
+    remaining = n
+    for i, w in enumerate(weights):
+        if remaining <= 0:
+            break
+        if w <= 0:
+            continue
+        k = binomial_variate(remaining, w / rest[i], rng)
+        counts[i] = k
+        remaining -= k
+    return counts
+
+
+def batch_indices(table, n, seed=None):
+    """
+    n draws from `table` as integer indices into table.items.
+
+    With NumPy this is one vectorized searchsorted over the cumulative
+    weights and returns an int64 array; without it, a list of ints from the
+    alias sampler. `seed` seeds a fresh generator (NumPy's default_rng or
+    random.Random) for repeatable batches.
+    """
+    if np is not None:
+        gen = np.random.default_rng(seed)
+        cdf = np.asarray(table.cum_weights, dtype=np.float64)
+        idx = np.searchsorted(cdf, gen.random(n) * cdf[-1], side="right")
+        # u * total can round up to total itself; keep it on the last row.
+        np.minimum(idx, len(cdf) - 1, out=idx)
+        return idx
+
+    rng = random.Random(seed) if seed is not None else random
+    roll_index = table.roll_index
+    return [roll_index(rng) for _ in range(n)]
+
+
+def iter_index_chunks(table, n, chunk_size=65536, seed=None):
+    """
+    n draws from `table` as a sequence of plain int lists of at most
+    chunk_size each, from a single generator so a seeded run is repeatable.
+    """
+    if np is not None:
+        gen = np.random.default_rng(seed)
+        cdf = np.asarray(table.cum_weights, dtype=np.float64)
+        last = len(cdf) - 1
+        while n > 0:
+            k = min(n, chunk_size)
+            idx = np.searchsorted(cdf, gen.random(k) * cdf[-1], side="right")
+            np.minimum(idx, last, out=idx)
+            yield idx.tolist()
+            n -= k
+        return
+
+    rng = random.Random(seed) if seed is not None else random
+    roll_index = table.roll_index
+    while n > 0:
+        k = min(n, chunk_size)
+        yield [roll_index(rng) for _ in range(k)]
+        n -= k
+
+
+def indices_to_labels(indices, labels):
+    """Map batch_indices() output onto a per-row label list."""
+    if np is not None and isinstance(indices, np.ndarray):
+        return np.asarray(labels, dtype=object)[indices]
+    return [labels[i] for i in indices]
+
+
+class _YearBucket:
+    __slots__ = ("years", "items", "weights", "cum_weights",
+                 "unknown_items", "unknown_weights", "unknown_cum_weights")
+
+    def __init__(self, dated, undated):
+        dated.sort(key=lambda t: t[0])
+        self.years = [y for y, _, _ in dated]
+        self.items = [d for _, d, _ in dated]
+        self.weights = [w for _, _, w in dated]
+        self.cum_weights = list(accumulate(self.weights))
+        self.unknown_items = [d for d, _ in undated]
+        self.unknown_weights = [w for _, w in undated]
+        self.unknown_cum_weights = list(accumulate(self.unknown_weights))
+
+    def slices(self, max_year, include_unknown_years):
+        """
+        Yield (items, weights, cum_weights, count) for the entries that pass
+        the year cutoff. Unknown-year entries are their own slice.
+        """
+        if max_year is None:
+            cut = len(self.years)
+        else:
+            cut = bisect_right(self.years, max_year)
+        if cut:
+            yield self.items, self.weights, self.cum_weights, cut
+        if self.unknown_items and (max_year is None or include_unknown_years):
+            yield (self.unknown_items, self.unknown_weights,
+                   self.unknown_cum_weights, len(self.unknown_items))
+
+
+class YearIndex:
+    """
+    Ship DB index: one bucket per (tech, rarity), entries sorted by intro
+    year with prefix weight sums. Rows without a year live in a separate
+    per-bucket list so a strict cutoff can leave them out.
+
+    `weight_for(row)` gives each row's weight when the index is built, and
+    `make_item(row)` (optional) what the index hands back for it, so
+    display records can be rendered once here instead of per roll.
+    Columnar stores (ship_store.ShipStore) are read column-wise.
+    """
+
+    def __init__(self, db, weight_for, make_item=None):
+        self.weight_for = weight_for
+        self.make_item = make_item
+        grouped = getattr(db, "grouped", None)
+        if grouped is not None:
+            rows = enumerate(grouped())
+        else:
+            rows = enumerate((d.get("tech"), d.get("rarity"), d.get("year"), d) for d in db)
+        # Position of each bucket's first row, so updated() can keep the
+        # bucket order (and with it seeded results) of a full rebuild.
+        self.first_row, self.buckets = self._build(rows)
+
+    def _build(self, rows):
+        first_row = {}
+        dated = {}
+        undated = {}
+        weight_for = self.weight_for
+        make_item = self.make_item
+        for i, (tech, rarity, y, d) in rows:
+            key = (tech, rarity)
+            if key not in first_row:
+                first_row[key] = i
+                dated[key] = []
+                undated[key] = []
+            item = d if make_item is None else make_item(d)
+            if y is None:
+                undated[key].append((item, weight_for(d)))
+            else:
+                dated[key].append((y, item, weight_for(d)))
+        return first_row, {key: _YearBucket(dated[key], undated[key]) for key in dated}
+
+    def updated(self, db, keys, weight_for=None):
+        """
+        Index over `db` -- a patched copy of the DB this index was built
+        from, same classes in the same order -- that rebuilds only the
+        buckets in `keys` (a changed row's old and new (tech, rarity), or
+        every bucket of a re-weighted rarity) and shares the rest with this
+        one. `weight_for` replaces the weight function from here on.
+        """
+        new = object.__new__(YearIndex)
+        new.weight_for = self.weight_for if weight_for is None else weight_for
+        new.make_item = self.make_item
+        keys = set(keys)
+
+        rows_with = getattr(db, "rows_with", None)
+        if rows_with is not None:
+            rows = []
+            for i in rows_with(keys):
+                row = db[i]
+                rows.append((i, (row.get("tech"), row.get("rarity"), db.year_at(i), row)))
+        else:
+            rows = [(i, (d.get("tech"), d.get("rarity"), d.get("year"), d))
+                    for i, d in enumerate(db) if (d.get("tech"), d.get("rarity")) in keys]
+        first_row, buckets = new._build(rows)
+
+        for key, bucket in self.buckets.items():
+            if key not in keys:
+                first_row[key] = self.first_row[key]
+                buckets[key] = bucket
+        order = sorted(first_row, key=first_row.get)
+        new.first_row = {key: first_row[key] for key in order}
+        new.buckets = {key: buckets[key] for key in order}
+        return new
+
+    def keys(self):
+        return self.buckets.keys()
+
+    def _slices(self, predicate, max_year, include_unknown_years):
+        for key, bucket in self.buckets.items():
+            if predicate is None or predicate(key):
+                yield from bucket.slices(max_year, include_unknown_years)
+
+    def candidates(self, predicate=None, max_year=None, include_unknown_years=True):
+        """
+        (items, weights) for every row passing the cutoff in the buckets
+        whose (tech, rarity) key satisfies `predicate` (None = all).
+        """
+        items = []
+        weights = []
+        for b_items, b_weights, _, cut in self._slices(predicate, max_year, include_unknown_years):
+            items.extend(b_items[:cut])
+            weights.extend(b_weights[:cut])
+        return items, weights
+
+    def roll(self, predicate=None, max_year=None, include_unknown_years=True, rng=random):
+        """
+        One weighted draw over the matching prefix slices without compiling
+        a table, O(buckets + log n). Returns None if nothing passes.
+
+        Maps a uniform draw onto the slices in candidates() order, so it
+        picks the same row as inverse-CDF sampling over that pool would.
+        """
+        slices = []
+        total = 0.0
+        unknown_ok = max_year is None or include_unknown_years
+        for key, b in self.buckets.items():
+            if predicate is not None and not predicate(key):
+                continue
+            years = b.years
+            if years:
+                cut = len(years) if max_year is None else bisect_right(years, max_year)
+                if cut:
+                    w = b.cum_weights[cut - 1]
+                    if w > 0:
+                        slices.append((b.items, b.cum_weights, cut, total))
+                        total += w
+            if unknown_ok and b.unknown_items:
+                cum = b.unknown_cum_weights
+                w = cum[-1]
+                if w > 0:
+                    slices.append((b.unknown_items, cum, len(cum), total))
+                    total += w
+        if not slices:
+            return None
+
+        u = rng.random() * total
+        for b_items, b_cum, cut, offset in reversed(slices):
+            if u >= offset:
+                return b_items[bisect_right(b_cum, u - offset, 0, cut - 1)]
+        return None
@@ -0,0 +1,349 @@
+"""
+Local stand-in for the Sarna pages the builder reads, serving the pages in
+bench_fixtures/ (standard library only).
+
+    python sarna_standin.py --port 8800 --latency 0.2 --copies 40
+    python build_dropship_overrides.py --base-url http://127.0.0.1:8800 --out-dir standin-build
+    python build_dropship_overrides.py --base-url http://127.0.0.1:8800 --backend api
+
+Serves:
+  /wiki/Category:DropShip_classes  the category listing, --per-page members per
+                                   page with "next page" links like MediaWiki's
+  /wiki/<Title>                    a fixture's .html
+  /wiki/<Title>?action=raw         a fixture's .wikitext
+  /api.php?action=query            list=categorymembers (cmlimit up to 500,
+                                   cmcontinue) and prop=revisions (up to 50
+                                   titles), formatversion=2 JSON
+An api.php query that matches one recorded in bench_fixtures/api/*.json
+gets that recorded response; any other is answered from the fixtures.
+Titles come from each fixture's "| name =" line; --copies N serves N numbered
+copies of every fixture ("Union 001", ...) for a bigger crawl. --latency
+delays every response, like a slow link. Responses carry an ETag and a
+Last-Modified (the fixture file's mtime) and conditional requests get a
+304, as on the real wiki. On exit (Ctrl-C or SIGTERM) it prints how many
+requests it answered, their rate and the most it saw in flight at once.
+"""
+import glob
+import hashlib
+import html
+import json
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, "bench_fixtures")
+CATEGORY_PATH = "/wiki/Category:DropShip_classes"
+CATEGORY_TITLE = "Category:DropShip classes"
+API_PATH = "/api.php"
+API_MAX_CMLIMIT = 500
+API_MAX_TITLES = 50
+
+
+def load_pages(fixture_dir=FIXTURE_DIR, copies=1):
+    """{title: (html, wikitext, mtime)} for every fixture with both files."""
+    pages = {}
+    for wt_path in sorted(glob.glob(os.path.join(fixture_dir, "*.wikitext"))):
+        html_path = wt_path[:-len(".wikitext")] + ".html"
+        if not os.path.exists(html_path):
+            continue
+        with open(wt_path, encoding="utf-8") as f:
+            wikitext = f.read()
+        with open(html_path, encoding="utf-8") as f:
+            page_html = f.read()
+        mtime = max(os.path.getmtime(wt_path), os.path.getmtime(html_path))
+        m = re.search(r"(?im)^\s*\|\s*name\s*=\s*(.+?)\s*$", wikitext)
+        name = m.group(1) if m else os.path.basename(wt_path)[:-len(".wikitext")]
+        if copies <= 1:
+            pages[name] = (page_html, wikitext, mtime)
+        else:
+            for k in range(1, copies + 1):
+                pages[f"{name} {k:03d}"] = (page_html, wikitext, mtime)
+    return pages
+
+
+def load_recorded(fixture_dir=FIXTURE_DIR):
+    """
+    [(params, response, mtime)] from fixture_dir/api/*.json, each file a
+    list of {"params": api.php query arguments, "response": the
+    formatversion=2 JSON MediaWiki answered}. Blank arguments are dropped,
+    as parse_qs drops them from requests.
+    """
+    recorded = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "api", "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            exchanges = json.load(f)
+        mtime = os.path.getmtime(path)
+        for ex in exchanges:
+            params = {k: str(v) for k, v in ex["params"].items() if v != ""}
+            recorded.append((params, ex["response"], mtime))
+    return recorded
+
+
+def recorded_answer(recorded, query):
+    """(response, mtime) recorded for a parsed api.php query, or None."""
+    params = {k: v[-1] for k, v in query.items()}
+    for want, response, mtime in recorded:
+        if want == params:
+            return response, mtime
+    return None
+
+
+def page_href(title):
+    return "/wiki/" + quote(title.replace(" ", "_"), safe="_()")
+
+
+def category_html(titles, pagefrom=None, per_page=200):
+    """One category page in MediaWiki's layout (members from `pagefrom` on)."""
+    titles = sorted(titles)
+    start = 0
+    if pagefrom:
+        start = next((i for i, t in enumerate(titles) if t >= pagefrom), len(titles))
+    shown = titles[start:start + per_page]
+    rest = titles[start + per_page:]
+
+    links = "\n".join(
+        f'<li><a href="{page_href(t)}" title="{html.escape(t)}">{html.escape(t)}</a></li>'
+        for t in shown
+    )
+    nav = ""
+    if rest:
+        href = f"{CATEGORY_PATH}?pagefrom={quote(rest[0])}"
+        nav = f'(<a href="{html.escape(href)}" title="Category:DropShip classes">next page</a>)'
+    return (
+        "<!DOCTYPE html><html><head><title>Category:DropShip classes</title></head><body>\n"
+        '<div id="mw-pages">\n'
+        f"<h2>Pages in category \"DropShip classes\"</h2>\n{nav}\n<ul>\n{links}\n</ul>\n{nav}\n"
+        "</div>\n"
+        '<div class="printfooter">Retrieved from the stand-in</div>\n'
+        "</body></html>\n"
+    )
+
+
+def _api_error(code, info):
+    return {"error": {"code": code, "info": info}}
+
+
+def _revision(title, page, rvprop):
+    """The revision MediaWiki would report for a fixture page (rvprop fields only)."""
+    wikitext, mtime = page[1], page[2]
+    digest = hashlib.sha1(f"{title}\0{wikitext}".encode("utf-8")).hexdigest()
+    rev = {}
+    if "ids" in rvprop:
+        rev.update(revid=int(digest[:7], 16), parentid=0)
+    if "timestamp" in rvprop:
+        rev["timestamp"] = datetime.fromtimestamp(int(mtime), timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if "content" in rvprop:
+        rev["slots"] = {"main": {"contentmodel": "wikitext", "contentformat": "text/x-wiki",
+                                 "content": wikitext}}
+    return rev
+
+
+def api_query(pages, query):
+    """action=query answers (formatversion=2) for the two modules the builder uses."""
+    def arg(name, default=None):
+        return query.get(name, [default])[0]
+
+    if arg("action") != "query":
+        return _api_error("badvalue", "Only action=query is supported by the stand-in.")
+    if arg("list") == "categorymembers":
+        if arg("cmtitle", "").replace("_", " ") != CATEGORY_TITLE:
+            return {"batchcomplete": True, "query": {"categorymembers": []}}
+        try:
+            limit = min(int(arg("cmlimit", 10)), API_MAX_CMLIMIT)
+        except ValueError:
+            return _api_error("badinteger", "Invalid value for parameter cmlimit.")
+        titles = sorted(pages)
+        start = 0
+        if arg("cmcontinue"):
+            start = next((i for i, t in enumerate(titles) if t >= arg("cmcontinue")), len(titles))
+        shown = titles[start:start + limit]
+        out = {"batchcomplete": True, "query": {"categorymembers": [
+            {"pageid": 1000 + titles.index(t), "ns": 0, "title": t} for t in shown
+        ]}}
+        if start + limit < len(titles):
+            out["continue"] = {"cmcontinue": titles[start + limit], "continue": "-||"}
+        return out
+    if arg("prop") == "revisions":
+        requested = [t for t in arg("titles", "").split("|") if t]
+        rvprop = set(arg("rvprop", "ids|timestamp|flags|comment|user").split("|"))
+        if len(requested) > API_MAX_TITLES:
+            return _api_error("toomanyvalues",
+                              f"Too many values supplied for parameter \"titles\". "
+                              f"The limit is {API_MAX_TITLES}.")
+        normalized, result = [], []
+        for title in requested:
+            norm = title.replace("_", " ").strip()
+            norm = norm[:1].upper() + norm[1:]
+            if norm != title:
+                normalized.append({"fromencoded": False, "from": title, "to": norm})
+            page = pages.get(norm)
+            if page is None:
+                result.append({"ns": 0, "title": norm, "missing": True})
+            else:
+                result.append({"pageid": 1000 + sorted(pages).index(norm), "ns": 0,
+                               "title": norm, "revisions": [_revision(norm, page, rvprop)]})
+        query_out = {"pages": result}
+        if normalized:
+            query_out["normalized"] = normalized
+        return {"batchcomplete": True, "query": query_out}
+    return _api_error("badvalue", "Only list=categorymembers and prop=revisions are supported.")
+
+
+class _Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.first = None
+        self.last = None
+
+    def enter(self):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            now = time.perf_counter()
+            self.first = self.first or now
+            self.last = now
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def count_not_modified(self):
+        with self.lock:
+            self.not_modified += 1
+
+    def summary(self):
+        span = (self.last - self.first) if self.requests > 1 else 0.0
+        rate = (self.requests - 1) / span if span > 0 else 0.0
+        return (f"{self.requests} requests ({self.not_modified} answered 304), "
+                f"{rate:.1f}/s between first and last, peak {self.peak} in flight")
+
+
+def make_handler(pages, latency=0.0, per_page=200, stats=None, recorded=()):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if stats is not None:
+                stats.enter()
+            try:
+                if latency > 0:
+                    time.sleep(latency)
+                self._answer()
+            finally:
+                if stats is not None:
+                    stats.leave()
+
+        def _answer(self):
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            path = unquote(url.path)
+            if path == API_PATH:
+                hit = recorded_answer(recorded, query)
+                if hit is not None:
+                    return self._send(200, json.dumps(hit[0]), "application/json", hit[1])
+                body = json.dumps(api_query(pages, query))
+                return self._send(200, body, "application/json", max(p[2] for p in pages.values()))
+            if path == CATEGORY_PATH:
+                body = category_html(pages, query.get("pagefrom", [None])[0], per_page)
+                mtime = max(page[2] for page in pages.values())
+                return self._send(200, body, "text/html", mtime)
+            if path.startswith("/wiki/"):
+                page = pages.get(path[len("/wiki/"):].replace("_", " "))
+                if page is not None:
+                    if query.get("action") == ["raw"]:
+                        return self._send(200, page[1], "text/x-wiki", page[2])
+                    return self._send(200, page[0], "text/html", page[2])
+            self._send(404, "Not found\n", "text/plain")
+
+        def _not_modified(self, etag, mtime):
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return etag in (t.strip() for t in if_none_match.split(","))
+            since = self.headers.get("If-Modified-Since")
+            if since is None:
+                return False
+            try:
+                return int(mtime) <= parsedate_to_datetime(since).timestamp()
+            except (TypeError, ValueError):
+                return False
+
+        def _send(self, status, text, content_type, mtime=None):
+            body = text.encode("utf-8")
+            etag = None
+            if mtime is not None:
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                if self._not_modified(etag, mtime):
+                    if stats is not None:
+                        stats.count_not_modified()
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            if etag is not None:
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve bench_fixtures/ like Sarna, for the builder.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="directory of .wikitext/.html pairs")
+    parser.add_argument("--copies", type=int, default=1, help="numbered copies of each fixture")
+    parser.add_argument("--per-page", type=int, default=200, help="members per category page")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to delay every response")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.fixtures, args.copies)
+    if not pages:
+        print(f"No fixture pages in {args.fixtures}.", file=sys.stderr)
+        return 1
+    # Recorded answers name the fixtures' own titles, not numbered copies.
+    recorded = load_recorded(args.fixtures) if args.copies <= 1 else []
+    stats = _Stats()
+    server = ThreadingHTTPServer(
+        (args.host, args.port),
+        make_handler(pages, args.latency, args.per_page, stats, recorded),
+    )
+    server.daemon_threads = True
+    host, port = server.server_address[:2]
+    print(f"Serving {len(pages)} pages ({len(recorded)} recorded API responses) "
+          f"on http://{host}:{port}/", flush=True)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(stats.summary(), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
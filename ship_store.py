@@ -0,0 +1,319 @@
+"""
+Columnar (struct-of-arrays) storage for the ship databases.
+
+ShipStore keeps one column per field instead of one dict per class:
+  - years in an array('h'), with UNKNOWN_YEAR standing in for None
+  - tech and rarity as small-int codes (array('B')) into per-store codebooks
+  - names as one list of interned strings
+Anything else on a row (e.g. variant_years on primitive JumpShips) goes in a
+sparse per-row dict.
+
+Indexing a store returns a ShipRow, a mutable dict-style view, so code that
+does d["year"], d.get("rarity") or d["tech"] = ... keeps working unchanged.
+A row stored without "tech" or "rarity" reads back without it, as the dict
+did, so d.get("rarity", "unknown") still gives "unknown".
+"""
+import sys
+from array import array
+from collections.abc import MutableMapping, Sequence
+
+UNKNOWN_YEAR = -32768
+CORE_FIELDS = ("name", "tech", "year", "rarity")
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<missing>"
+
+
+# Codebook value for a tech/rarity the row did not have at all.
+_MISSING = _Missing()
+
+
+def _plain(values):
+    """Codebook values as dict.get() would report them (missing -> None)."""
+    return [None if v is _MISSING else v for v in values]
+
+
+class _Codebook:
+    """Value <-> small-int code mapping (None and _MISSING are valid values)."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self, values=()):
+        self.values = []
+        self.codes = {}
+        for v in values:
+            self.code(v)
+
+    def code(self, value):
+        c = self.codes.get(value)
+        if c is None:
+            c = len(self.values)
+            if c > 255:
+                raise ValueError("too many distinct values for a byte code")
+            self.values.append(value)
+            self.codes[value] = c
+        return c
+
+
+class ShipStore(Sequence):
+    """Ship DB as parallel columns. Behaves like a list of row mappings."""
+
+    __slots__ = ("names", "years", "tech", "rarity",
+                 "tech_book", "rarity_book", "extras", "generation")
+
+    def __init__(self):
+        self.names = []
+        self.years = array("h")
+        self.tech = array("B")
+        self.rarity = array("B")
+        self.tech_book = _Codebook()
+        self.rarity_book = _Codebook()
+        self.extras = []
+        # Bumped on every write so caches keyed on it notice in-place edits.
+        self.generation = 0
+
+    @classmethod
+    def from_rows(cls, rows):
+        store = cls()
+        for row in rows:
+            store.append(row)
+        store.generation = 0
+        return store
+
+    def append(self, row):
+        self.names.append(sys.intern(row["name"]))
+        year = row.get("year")
+        self.years.append(UNKNOWN_YEAR if year is None else year)
+        self.tech.append(self.tech_book.code(row.get("tech", _MISSING)))
+        self.rarity.append(self.rarity_book.code(row.get("rarity", _MISSING)))
+        extra = {k: v for k, v in row.items() if k not in CORE_FIELDS}
+        self.extras.append(extra or None)
+        self.generation += 1
+
+    def copy(self):
+        """
+        Independent copy (columns, codebooks and extras dicts), e.g. to
+        patch rows while readers keep using this store unchanged.
+        """
+        store = type(self)()
+        store.names = list(self.names)
+        store.years = array("h", self.years)
+        store.tech = array("B", self.tech)
+        store.rarity = array("B", self.rarity)
+        store.tech_book = _Codebook(self.tech_book.values)
+        store.rarity_book = _Codebook(self.rarity_book.values)
+        store.extras = [dict(e) if e else None for e in self.extras]
+        store.generation = self.generation
+        return store
+
+    def set_row(self, i, row):
+        """Replace row i with the mapping `row` (fields not in it are dropped)."""
+        self.names[i] = sys.intern(row["name"])
+        year = row.get("year")
+        self.years[i] = UNKNOWN_YEAR if year is None else year
+        self.tech[i] = self.tech_book.code(row.get("tech", _MISSING))
+        self.rarity[i] = self.rarity_book.code(row.get("rarity", _MISSING))
+        extra = {k: v for k, v in row.items() if k not in CORE_FIELDS}
+        self.extras[i] = extra or None
+        self.generation += 1
+
+    # ---- Sequence protocol ----
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [ShipRow(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self.names)
+        if not 0 <= i < len(self.names):
+            raise IndexError("ShipStore index out of range")
+        return ShipRow(self, i)
+
+    def __iter__(self):
+        for i in range(len(self.names)):
+            yield ShipRow(self, i)
+
+    def __repr__(self):
+        return f"<ShipStore {len(self)} classes>"
+
+    def to_rows(self):
+        return [dict(row) for row in self]
+
+    # ---- Column access ----
+    def year_at(self, i):
+        y = self.years[i]
+        return None if y == UNKNOWN_YEAR else y
+
+    def grouped(self):
+        """
+        Yield (tech, rarity, year_or_None, row) straight from the columns,
+        for index builders that would otherwise do per-row dict lookups.
+        A missing tech/rarity comes out as None, like row.get() would.
+        """
+        tech_values = _plain(self.tech_book.values)
+        rarity_values = _plain(self.rarity_book.values)
+        for i, (y, t, r) in enumerate(zip(self.years, self.tech, self.rarity)):
+            yield (tech_values[t], rarity_values[r],
+                   None if y == UNKNOWN_YEAR else y, ShipRow(self, i))
+
+    def rows_with(self, keys):
+        """
+        Indices, in row order, of the rows whose (tech, rarity) is one of
+        `keys` (a missing field matches None, as in grouped()). The pairs
+        are mapped to codes once; each row check is then a set lookup on
+        the code arrays.
+        """
+        keys = set(keys)
+        wanted = {
+            (t, r)
+            for t, tv in enumerate(_plain(self.tech_book.values))
+            for r, rv in enumerate(_plain(self.rarity_book.values))
+            if (tv, rv) in keys
+        }
+        return [i for i, pair in enumerate(zip(self.tech, self.rarity)) if pair in wanted]
+
+    def counts(self, field):
+        """
+        {value: count} for "tech" or "rarity", counted on the code column
+        (rows without the field count under None).
+        """
+        column, book = {
+            "tech": (self.tech, self.tech_book),
+            "rarity": (self.rarity, self.rarity_book),
+        }[field]
+        tally = [0] * len(book.values)
+        for c in column:
+            tally[c] += 1
+        out = {}
+        for value, k in zip(_plain(book.values), tally):
+            if k:
+                out[value] = out.get(value, 0) + k
+        return out
+
+    # ---- Serialization (marshal-friendly) ----
+    def to_columns(self):
+        return {
+            "names": list(self.names),
+            "years": self.years.tobytes(),
+            "tech": self.tech.tobytes(),
+            "rarity": self.rarity.tobytes(),
+            "tech_values": _plain(self.tech_book.values),
+            "rarity_values": _plain(self.rarity_book.values),
+            # Codes standing for a missing field (marshal can't store _MISSING).
+            "tech_missing": self.tech_book.codes.get(_MISSING),
+            "rarity_missing": self.rarity_book.codes.get(_MISSING),
+            "extras": list(self.extras),
+        }
+
+    @classmethod
+    def from_columns(cls, cols):
+        store = cls()
+        store.names = [sys.intern(n) for n in cols["names"]]
+        store.years.frombytes(cols["years"])
+        store.tech.frombytes(cols["tech"])
+        store.rarity.frombytes(cols["rarity"])
+        store.tech_book = _Codebook(_with_missing(cols["tech_values"], cols["tech_missing"]))
+        store.rarity_book = _Codebook(_with_missing(cols["rarity_values"], cols["rarity_missing"]))
+        store.extras = list(cols["extras"])
+        return store
+
+
+def _with_missing(values, missing_code):
+    values = list(values)
+    if missing_code is not None:
+        values[missing_code] = _MISSING
+    return values
+
+
+class ShipRow(MutableMapping):
+    """Dict-style view of one ShipStore row; writes go to the columns."""
+
+    __slots__ = ("store", "i")
+
+    def __init__(self, store, i):
+        self.store = store
+        self.i = i
+
+    def __getitem__(self, key):
+        s = self.store
+        i = self.i
+        if key == "name":
+            return s.names[i]
+        if key == "year":
+            y = s.years[i]
+            return None if y == UNKNOWN_YEAR else y
+        if key == "tech" or key == "rarity":
+            if key == "tech":
+                value = s.tech_book.values[s.tech[i]]
+            else:
+                value = s.rarity_book.values[s.rarity[i]]
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        extra = s.extras[i]
+        if extra is None:
+            raise KeyError(key)
+        return extra[key]
+
+    def __setitem__(self, key, value):
+        s = self.store
+        i = self.i
+        if key == "name":
+            s.names[i] = sys.intern(value)
+        elif key == "year":
+            s.years[i] = UNKNOWN_YEAR if value is None else value
+        elif key == "tech":
+            s.tech[i] = s.tech_book.code(value)
+        elif key == "rarity":
+            s.rarity[i] = s.rarity_book.code(value)
+        else:
+            if s.extras[i] is None:
+                s.extras[i] = {}
+            s.extras[i][key] = value
+        s.generation += 1
+
+    def __delitem__(self, key):
+        if key == "tech" or key == "rarity":
+            self[key]  # KeyError if already missing
+            self[key] = _MISSING
+            return
+        if key in CORE_FIELDS:
+            raise KeyError(f"cannot delete core field {key!r}")
+        extra = self.store.extras[self.i]
+        if extra is None:
+            raise KeyError(key)
+        del extra[key]
+        self.store.generation += 1
+
+    def _present(self):
+        s = self.store
+        i = self.i
+        fields = ["name", "year"]
+        if s.tech_book.values[s.tech[i]] is not _MISSING:
+            fields.insert(1, "tech")
+        if s.rarity_book.values[s.rarity[i]] is not _MISSING:
+            fields.append("rarity")
+        return fields
+
+    def __iter__(self):
+        yield from self._present()
+        extra = self.store.extras[self.i]
+        if extra:
+            yield from extra
+
+    def __len__(self):
+        extra = self.store.extras[self.i]
+        return len(self._present()) + (len(extra) if extra else 0)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __reduce__(self):
+        # Pickle as a plain dict so sending a row to another process does
+        # not drag the whole store along.
+        return (dict, (dict(self),))
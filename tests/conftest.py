@@ -0,0 +1,24 @@
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sarna_standin  # noqa: E402
+
+
+@pytest.fixture
+def standin():
+    """sarna_standin serving the fixtures on a free port: (base URL, pages, stats)."""
+    pages = sarna_standin.load_pages()
+    stats = sarna_standin._Stats()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), sarna_standin.make_handler(pages, stats=stats))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", pages, stats
+    server.shutdown()
+    server.server_close()
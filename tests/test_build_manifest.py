@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+import build_dropship_overrides as bdo
+from build_dropship_overrides import BuildManifest
+
+
+@pytest.fixture
+def builder(standin, tmp_path, monkeypatch):
+    """build(manifest_name, fresh=False) -> overrides, against the stand-in, uncached."""
+    base = standin[0]
+    monkeypatch.setattr(bdo, "RATE_LIMITER", bdo.HostRateLimiter(0))
+    monkeypatch.setattr(bdo, "PAGE_CACHE", None)
+    category_url = base + bdo.CATEGORY_PATH
+
+    def build(name="manifest.json", fresh=False):
+        manifest = BuildManifest(str(tmp_path / name), category_url, fresh=fresh)
+        overrides, failures = bdo.build_overrides(category_url, workers=1, manifest=manifest)
+        manifest.save(complete=True)
+        assert failures == []
+        return overrides
+
+    return build
+
+
+def test_interrupted_build_resumes_where_it_stopped(builder, standin, monkeypatch):
+    _, pages, stats = standin
+    expected = builder("full.json")
+    parse_page = bdo.parse_page
+
+    def interrupt_on_second_page(title, url, wt):
+        if title == sorted(pages)[1]:
+            raise KeyboardInterrupt
+        return parse_page(title, url, wt)
+
+    monkeypatch.setattr(bdo, "parse_page", interrupt_on_second_page)
+    with pytest.raises(KeyboardInterrupt):
+        builder()
+    # Let a page the pool had already started finish, as the build doesn't wait.
+    for thread in threading.enumerate():
+        if thread.name.startswith("ThreadPoolExecutor"):
+            thread.join()
+    monkeypatch.setattr(bdo, "parse_page", parse_page)
+
+    requests = stats.requests
+    assert builder() == expected
+    # The category listing plus the pages the interrupted run did not finish.
+    assert stats.requests - requests == 1 + len(pages) - 1
+
+
+def test_unchanged_pages_are_not_parsed_again(builder, standin, monkeypatch):
+    _, pages, _ = standin
+    expected = builder()
+    parsed = []
+    parse_page = bdo.parse_page
+
+    def counting(title, url, wt):
+        parsed.append(title)
+        return parse_page(title, url, wt)
+
+    monkeypatch.setattr(bdo, "parse_page", counting)
+    assert builder() == expected
+    assert parsed == []
+
+    html_text, wikitext, mtime = pages["Union"]
+    pages["Union"] = (html_text, wikitext.replace("most common", "rarely seen"), mtime + 60)
+    assert builder().keys() == expected.keys()
+    assert parsed == ["Union"]
+
+    parsed.clear()
+    builder(fresh=True)
+    assert sorted(parsed) == sorted(pages)
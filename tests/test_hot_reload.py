@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import bt_ship_rollers as bt
+
+
+@pytest.fixture
+def tuning(tmp_path, monkeypatch):
+    """The tuning files copied to tmp_path and loaded from there."""
+    paths = {}
+    for attr in ("LOCAL_OVERRIDES_PATH", "PRIMITIVE_OVERRIDES_PATH", "RARITY_WEIGHTS_PATH"):
+        path = str(tmp_path / os.path.basename(getattr(bt, attr)))
+        shutil.copyfile(getattr(bt, attr), path)
+        monkeypatch.setattr(bt, attr, path)
+        paths[attr] = path
+    monkeypatch.setattr(bt, "DATA_CACHE_PATH", str(tmp_path / "bt_ship_data.marshal"))
+    bt.load_ship_data(use_cache=False)
+    bt.invalidate_roll_cache()
+    yield paths
+    monkeypatch.undo()
+    bt.load_ship_data(use_cache=False)
+    bt.invalidate_roll_cache()
+
+
+def _edit(path, change):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    change(data)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def _snapshot():
+    rng = bt.make_rng(42)
+    return {
+        "dropships": bt.DROPSHIP_DB.to_rows(),
+        "primitives": bt.PRIMITIVE_JUMPSHIP_DB.to_rows(),
+        "pool": bt.dropship_index().candidates(max_year=3025),
+        "odds": bt.dropship_probabilities(year=3025, rarity_mode="common_uncommon"),
+        "primitive_odds": bt.db_probabilities(bt.PRIMITIVE_JUMPSHIP_DB, max_year=2300,
+                                              rarity_weights=bt.PRIMITIVE_RARITY_WEIGHTS),
+        "rolls": [bt.roll_dropship(year=y, rng=rng) for y in (2700, 3025, 3025, 3067)],
+    }
+
+
+def test_hot_reload_matches_a_full_rebuild(tuning):
+    if not bt.DROPSHIP_DB:
+        pytest.skip("no DropShip data built")
+    before = _snapshot()  # also warms the index and roll cache the reload patches
+
+    def dropships(data):
+        data["Talon"]["rarity"] = "common"
+        data["League"] = {"decline_year": 2780, "extinct_year": 2800}
+
+    def primitives(data):
+        data["Predator"] = {"rarity": "rare", "year": 2150}
+
+    def weights(data):
+        data["dropship"]["uncommon"] = 5.0
+
+    _edit(tuning["LOCAL_OVERRIDES_PATH"], dropships)
+    _edit(tuning["PRIMITIVE_OVERRIDES_PATH"], primitives)
+    _edit(tuning["RARITY_WEIGHTS_PATH"], weights)
+
+    summary = bt.poll_overrides()
+    assert "error" not in summary
+    assert len(summary["files"]) == 3
+    assert bt.poll_overrides() is None
+    reloaded = _snapshot()
+    assert reloaded["dropships"] != before["dropships"]
+    assert reloaded["odds"] != before["odds"]
+    assert reloaded["primitive_odds"] != before["primitive_odds"]
+
+    bt.load_ship_data(use_cache=False)
+    bt.invalidate_roll_cache()
+    assert _snapshot() == reloaded
+
+
+def test_unreadable_file_keeps_the_previous_data(tuning):
+    before = _snapshot()
+    with open(tuning["LOCAL_OVERRIDES_PATH"], "w", encoding="utf-8") as f:
+        f.write("{not json")
+    summary = bt.poll_overrides()
+    assert "error" in summary
+    assert _snapshot() == before
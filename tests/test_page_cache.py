@@ -0,0 +1,51 @@
+import pytest
+
+import build_dropship_overrides as bdo
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(bdo, "RATE_LIMITER", bdo.HostRateLimiter(0))
+    page_cache = bdo.PageCache(str(tmp_path / "cache"), ttl=0)
+    monkeypatch.setattr(bdo, "PAGE_CACHE", page_cache)
+    return page_cache
+
+
+def test_unchanged_page_is_revalidated_with_a_304(standin, cache):
+    base, pages, stats = standin
+    url = base + "/wiki/Union?action=raw"
+    first = bdo.fetch(url)
+    assert first == pages["Union"][1]
+    assert bdo.fetch(url) == first
+    assert stats.not_modified == 1
+    assert (cache.stats["downloaded"], cache.stats["revalidated"]) == (1, 1)
+
+
+def test_changed_page_is_downloaded_again(standin, cache):
+    base, pages, stats = standin
+    url = base + "/wiki/Union?action=raw"
+    bdo.fetch(url)
+    html_text, wikitext, mtime = pages["Union"]
+    pages["Union"] = (html_text, wikitext + "\n[[Category:Edited]]\n", mtime + 60)
+    assert bdo.fetch(url).endswith("[[Category:Edited]]\n")
+    assert stats.not_modified == 0
+    assert cache.stats["downloaded"] == 2
+
+
+def test_fresh_entry_is_used_without_asking(standin, cache):
+    base, _, stats = standin
+    cache.ttl = None
+    url = base + "/wiki/Hector"
+    bdo.fetch(url)
+    bdo.fetch(url)
+    assert stats.requests == 1
+    assert cache.stats["fresh"] == 1
+
+
+def test_offline_build_without_a_cached_listing_fails_cleanly(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(bdo, "PAGE_CACHE", None)
+    monkeypatch.setattr(bdo, "RATE_LIMITER", bdo.RATE_LIMITER)
+    status = bdo.main(["--offline", "--base-url", "http://127.0.0.1:9",
+                       "--cache-dir", str(tmp_path / "cache"), "--out-dir", str(tmp_path)])
+    assert status == 1
+    assert "--offline needs a previous online run" in capsys.readouterr().err
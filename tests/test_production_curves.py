@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+import bt_ship_rollers as bt
+
+
+DB = [
+    {"name": "Steady", "tech": "IS", "year": 2500, "rarity": "common"},
+    {"name": "Ramped", "tech": "IS", "year": 2500, "rarity": "common", "ramp_years": 20},
+    {"name": "Fading", "tech": "IS", "year": 2500, "rarity": "common",
+     "decline_year": 2600, "extinct_year": 2700},
+]
+
+
+def test_production_factor_ramps_declines_and_ends():
+    assert bt.production_factor(2500, 2509, ramp_years=20) == pytest.approx(0.5)
+    assert bt.production_factor(2500, 2519, ramp_years=20) == 1.0
+    assert bt.production_factor(2500, 2650, decline_year=2600, extinct_year=2700) == 0.5
+    assert bt.production_factor(2500, 2700, decline_year=2600, extinct_year=2700) == 0.0
+    floor = bt.production_factor(2500, 3000, decline_year=2600)
+    assert floor == pytest.approx(bt.PRODUCTION_DECLINE_FLOOR)
+
+
+def test_probabilities_follow_the_curves_by_year():
+    probs = bt.db_probabilities(DB, max_year=2509)
+    assert probs["Ramped"] == pytest.approx(probs["Steady"] * 0.5)
+    assert probs["Fading"] == pytest.approx(probs["Steady"])
+
+    probs = bt.db_probabilities(DB, max_year=2650)
+    assert probs["Ramped"] == pytest.approx(probs["Steady"])
+    assert probs["Fading"] == pytest.approx(probs["Steady"] * 0.5)
+
+    assert "Fading" not in bt.db_probabilities(DB, max_year=2700)
+    assert bt.db_probabilities(DB) == pytest.approx({"Steady": 1 / 3, "Ramped": 1 / 3, "Fading": 1 / 3})
+
+
+def test_extinct_classes_are_never_rolled():
+    rng = random.Random(5)
+    picks = {bt.roll_from_db(DB, max_year=2750, rng=rng)["name"] for _ in range(200)}
+    assert picks == {"Steady", "Ramped"}
+    picks = {d["name"] for d in bt.roll_from_db(DB, max_year=2750, rng=rng, n=200)}
+    assert picks == {"Steady", "Ramped"}
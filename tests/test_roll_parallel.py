@@ -0,0 +1,23 @@
+import bt_ship_rollers as bt
+
+
+def test_db_rolls_match_for_any_worker_count():
+    kwargs = dict(max_year=2400, include_unknown_years=False)
+    one = bt.roll_parallel("db", 2500, seed=7, workers=1, shard_size=1000, **kwargs)
+    three = bt.roll_parallel("db", 2500, seed=7, workers=3, shard_size=1000, **kwargs)
+    assert one == three
+    assert len(one) == 2500
+    assert all(type(pick) is dict and pick["year"] <= 2400 for pick in one)
+    assert one != bt.roll_parallel("db", 2500, seed=8, workers=1, shard_size=1000, **kwargs)
+
+
+def test_db_rolls_from_a_given_db():
+    db = [{"name": "Only", "tech": "IS", "year": 2200, "rarity": "common"}]
+    assert bt.roll_parallel("db", 5, seed=1, workers=2, shard_size=2, db=db) == db * 5
+    assert bt.roll_parallel("db", 3, seed=1, db=db, max_year=2100) == [None] * 3
+
+
+def test_dropship_rolls_match_for_any_worker_count():
+    one = bt.roll_parallel("dropship", 600, seed=3, workers=1, shard_size=250, year=3050)
+    two = bt.roll_parallel("dropship", 600, seed=3, workers=2, shard_size=250, year=3050)
+    assert one == two
@@ -0,0 +1,29 @@
+from urllib.parse import parse_qs, urlencode
+
+import sarna_standin
+
+
+def test_recorded_revisions_hold_the_fixture_wikitext():
+    pages = sarna_standin.load_pages()
+    recorded = sarna_standin.load_recorded()
+    assert recorded
+    for _, response, _ in recorded:
+        for page in response["query"].get("pages", []):
+            for rev in page["revisions"]:
+                if "slots" in rev:
+                    assert rev["slots"]["main"]["content"] == pages[page["title"]][1]
+
+
+def test_recorded_answer_matches_the_builders_query():
+    recorded = sarna_standin.load_recorded()
+    query = parse_qs(urlencode({
+        "list": "categorymembers", "cmtitle": "Category:DropShip classes", "cmtype": "page",
+        "cmlimit": 500, "action": "query", "format": "json", "formatversion": "2",
+        "continue": "",
+    }))
+    response, _ = sarna_standin.recorded_answer(recorded, query)
+    titles = [m["title"] for m in response["query"]["categorymembers"]]
+    assert titles == sorted(sarna_standin.load_pages())
+
+    query["cmlimit"] = ["2"]
+    assert sarna_standin.recorded_answer(recorded, query) is None
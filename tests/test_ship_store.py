@@ -0,0 +1,64 @@
+import marshal
+
+from ship_store import ShipStore
+
+
+ROWS = [
+    {"name": "Union", "tech": "IS", "year": 2708, "rarity": "common"},
+    {"name": "Partial", "year": 3050},
+    {"name": "Untyped", "tech": None, "year": None, "rarity": None, "extinct_year": 3100},
+]
+
+
+def test_rows_read_back_like_the_dicts_they_came_from():
+    store = ShipStore.from_rows(ROWS)
+    assert store.to_rows() == ROWS
+    for row, d in zip(store, ROWS):
+        for key in ("tech", "rarity", "extinct_year"):
+            assert (key in row) == (key in d)
+            assert row.get(key, "unknown") == d.get(key, "unknown")
+
+
+def test_row_without_rarity_is_not_reported_as_none():
+    row = ShipStore.from_rows(ROWS)[1]
+    assert "rarity" not in row
+    assert row.get("rarity", "unknown") == "unknown"
+    assert row.get("rarity") is None
+    assert dict(row) == {"name": "Partial", "year": 3050}
+
+
+def test_missing_fields_survive_marshal_and_set_row():
+    store = ShipStore.from_rows(ROWS)
+    store = ShipStore.from_columns(marshal.loads(marshal.dumps(store.to_columns())))
+    assert store.to_rows() == ROWS
+
+    store.set_row(0, {"name": "Union", "year": 2708})
+    assert dict(store[0]) == {"name": "Union", "year": 2708}
+    store[0]["rarity"] = "rare"
+    assert store[0]["rarity"] == "rare"
+    del store[0]["rarity"]
+    assert "rarity" not in store[0]
+
+
+def test_column_helpers_treat_missing_as_none():
+    store = ShipStore.from_rows(ROWS)
+    assert [(t, r) for t, r, _, _ in store.grouped()] == [("IS", "common"), (None, None), (None, None)]
+    assert store.counts("rarity") == {"common": 1, None: 2}
+
+
+def test_row_without_rarity_rolls_with_the_unknown_weight():
+    import bt_ship_rollers as bt
+
+    rows = [ROWS[0], {"name": "Partial", "tech": "IS", "year": 3050}]
+    weights = {"common": 1.0, "unknown": 0.0}
+    for db in (rows, ShipStore.from_rows(rows)):
+        probs = bt.db_probabilities(db, rarity_weights=weights)
+        assert probs["Union"] == 1.0 and not probs.get("Partial")
+    assert bt.format_primitive_jumpship(ShipStore.from_rows(rows)[1]).endswith("[unknown]")
+
+
+def test_rows_with_matches_grouped_keys():
+    store = ShipStore.from_rows(ROWS)
+    assert store.rows_with({("IS", "common")}) == [0]
+    assert store.rows_with({(None, None)}) == [1, 2]
+    assert store.rows_with({("Clan", "rare")}) == []
@@ -0,0 +1,40 @@
+import pytest
+
+import build_dropship_overrides as bdo
+import sarna_standin
+
+PAGES = sarna_standin.load_pages()
+
+
+@pytest.mark.parametrize("title", sorted(PAGES))
+def test_wikitext_prose_guesses_like_the_rendered_page(title):
+    page_html, wikitext, _ = PAGES[title]
+    prose = bdo.wikitext_prose(wikitext)
+    assert prose is not None
+    assert bdo.guess_rarity(prose)[0] == bdo.guess_rarity(bdo.strip_tags(page_html))[0]
+
+
+@pytest.mark.parametrize("title", sorted(PAGES))
+def test_parse_page_needs_no_html_fetch(title, monkeypatch):
+    def fetch(url, timeout=30):
+        raise AssertionError(f"fetched {url}")
+
+    monkeypatch.setattr(bdo, "fetch", fetch)
+    name, entry = bdo.parse_page(title, "http://wiki.invalid/wiki/" + title, PAGES[title][1])
+    assert name == title
+    assert entry["year"] is not None and entry["tech"] in ("IS", "Clan")
+
+
+def test_redirect_falls_back_to_the_rendered_page(monkeypatch):
+    page_html = PAGES["Union"][0]
+    fetched = []
+
+    def fetch(url, timeout=30):
+        fetched.append(url)
+        return page_html
+
+    monkeypatch.setattr(bdo, "fetch", fetch)
+    assert bdo.wikitext_prose("#REDIRECT [[Union]]") is None
+    _, entry = bdo.parse_page("Union", "http://wiki.invalid/wiki/Union", "#REDIRECT [[Union]]")
+    assert fetched == ["http://wiki.invalid/wiki/Union"]
+    assert entry["rarity"] == bdo.guess_rarity(bdo.strip_tags(page_html))[0]
@@ -0,0 +1,55 @@
+import random
+
+import bt_ship_rollers as bt
+from roll_tables import RollTable, YearIndex
+
+
+DB = [
+    {"name": f"Ship {i}", "tech": ("IS", "Clan")[i % 2],
+     "rarity": ("common", "rare", "unknown")[i % 3],
+     "year": None if i % 7 == 0 else 2400 + (i * 37) % 700}
+    for i in range(60)
+]
+WEIGHTS = {"common": 10.0, "rare": 1.0, "unknown": 0.5}
+
+
+def _index():
+    return YearIndex(DB, lambda d: WEIGHTS[d["rarity"]])
+
+
+def test_cutoff_candidates_match_a_plain_filter():
+    index = _index()
+    for max_year in (None, 2399, 2600, 3100):
+        for include_unknown in (True, False):
+            items, weights = index.candidates(lambda key: key[0] == "IS", max_year, include_unknown)
+            expected = [
+                d for d in DB if d["tech"] == "IS" and (
+                    max_year is None
+                    or (d["year"] is None and include_unknown)
+                    or (d["year"] is not None and d["year"] <= max_year))
+            ]
+            assert sorted(d["name"] for d in items) == sorted(d["name"] for d in expected)
+            assert weights == [WEIGHTS[d["rarity"]] for d in items]
+
+
+def test_index_draw_matches_the_compiled_table():
+    index = _index()
+    for max_year in (2450, 2800, None):
+        table = RollTable(*index.candidates(max_year=max_year, include_unknown_years=False))
+        for seed in range(200):
+            picked = index.roll(max_year=max_year, include_unknown_years=False,
+                                rng=random.Random(seed))
+            assert picked is table.roll_cdf(random.Random(seed))
+    assert index.roll(max_year=2000, include_unknown_years=False) is None
+
+
+def test_seeded_dropship_rolls_do_not_depend_on_the_cache():
+    def rolls():
+        rng = bt.make_rng(99)
+        return [bt.roll_dropship(year=y, rng=rng) for y in (2700, 3025, 2700, 3050, 3025)]
+
+    bt.invalidate_roll_cache()
+    cold = rolls()
+    assert rolls() == cold
+    bt.invalidate_roll_cache()
+    assert rolls() == cold